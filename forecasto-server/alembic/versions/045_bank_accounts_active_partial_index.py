@@ -0,0 +1,38 @@
+"""replace the bank_accounts.is_active index with a partial owner index
+
+The full-column boolean index on is_active (present only on databases built
+with create_all) is too unselective to help. list_user_accounts filters on
+owner_id + is_active and orders by name, so a partial index on
+(owner_id, name) restricted to active rows serves it without a sort.
+
+Revision ID: 045
+Revises: 044
+Create Date: 2026-10-16
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "045"
+down_revision: Union[str, None] = "044"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_bank_accounts_is_active")
+    op.create_index(
+        "ix_bank_accounts_owner_active",
+        "bank_accounts",
+        ["owner_id", "name"],
+        sqlite_where=sa.text("is_active = 1"),
+        postgresql_where=sa.text("is_active"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_bank_accounts_owner_active", table_name="bank_accounts")
+    op.create_index("ix_bank_accounts_is_active", "bank_accounts", ["is_active"])
@@ -0,0 +1,36 @@
+"""add a (workspace_id, area, date_cashflow) index on records
+
+Area-scoped cashflow listings filter on workspace_id and area and range or
+order on date_cashflow. One composite index serves all three predicates and
+replaces both the (workspace_id, area) index from 001 and the single-column
+area index that create_all-built databases carry.
+
+Revision ID: 046
+Revises: 045
+Create Date: 2026-10-16
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "046"
+down_revision: Union[str, None] = "045"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_records_ws_area_date",
+        "records",
+        ["workspace_id", "area", "date_cashflow"],
+    )
+    op.execute("DROP INDEX IF EXISTS idx_records_workspace_area")
+    op.execute("DROP INDEX IF EXISTS ix_records_area")
+
+
+def downgrade() -> None:
+    op.drop_index("ix_records_ws_area_date", table_name="records")
+    op.create_index("idx_records_workspace_area", "records", ["workspace_id", "area"])
@@ -0,0 +1,35 @@
+"""add a partial (workspace_id, date_cashflow) index on live records
+
+Cashflow queries scan a workspace's records by date_cashflow range and
+always filter deleted_at IS NULL. Restricting the index to live rows keeps
+soft-deleted records out of it.
+
+Revision ID: 047
+Revises: 046
+Create Date: 2026-10-16
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "047"
+down_revision: Union[str, None] = "046"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_records_live_ws_date",
+        "records",
+        ["workspace_id", "date_cashflow"],
+        sqlite_where=sa.text("deleted_at IS NULL"),
+        postgresql_where=sa.text("deleted_at IS NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_records_live_ws_date", table_name="records")
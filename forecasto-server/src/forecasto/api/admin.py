@@ -52,6 +52,11 @@ logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
+def _admin_service(db: Annotated[AsyncSession, Depends(get_db)]) -> AdminService:
+    """Dependency: one AdminService per request (cached by FastAPI)."""
+    return AdminService(db)
+
+
 # Registration Code Batch Endpoints
 
 
@@ -59,10 +64,9 @@ router = APIRouter()
 async def create_registration_codes(
     data: CreateBatchRequest,
     admin_user: Annotated[User, Depends(require_admin)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    service: Annotated[AdminService, Depends(_admin_service)],
 ):
     """Generate a batch of registration codes."""
-    service = AdminService(db)
     batch = await service.create_batch(data, admin_user)
     return {"success": True, "batch": batch}
 
@@ -70,10 +74,9 @@ async def create_registration_codes(
 @router.get("/registration-codes/batches", response_model=dict)
 async def list_batches(
     admin_user: Annotated[User, Depends(require_admin)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    service: Annotated[AdminService, Depends(_admin_service)],
 ):
     """List all registration code batches."""
-    service = AdminService(db)
     batches = await service.list_batches()
     return {"success": True, "batches": batches}
 
@@ -82,10 +85,9 @@ async def list_batches(
 async def get_batch(
     batch_id: str,
     admin_user: Annotated[User, Depends(require_admin)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    service: Annotated[AdminService, Depends(_admin_service)],
 ):
     """Get a specific batch with all its codes."""
-    service = AdminService(db)
     batch = await service.get_batch(batch_id)
     return {"success": True, "batch": batch}
 
@@ -96,7 +98,7 @@ async def get_batch(
 @router.get("/registration-codes", response_model=dict)
 async def list_codes(
     admin_user: Annotated[User, Depends(require_admin)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    service: Annotated[AdminService, Depends(_admin_service)],
     batch_id: str | None = Query(None),
     status: str | None = Query("all"),
     page: int = Query(1, ge=1),
@@ -109,7 +111,6 @@ async def list_codes(
         page=page,
         page_size=page_size,
     )
-    service = AdminService(db)
     codes, total = await service.list_codes(filters)
     return {"success": True, "codes": codes, "total": total}
 
@@ -118,10 +119,9 @@ async def list_codes(
 async def get_code(
     code_id: str,
     admin_user: Annotated[User, Depends(require_admin)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    service: Annotated[AdminService, Depends(_admin_service)],
 ):
     """Get a specific registration code."""
-    service = AdminService(db)
     code = await service.get_code(code_id)
     return {"success": True, "code": code}
 
@@ -130,10 +130,9 @@ async def get_code(
 async def revoke_code(
     code_id: str,
     admin_user: Annotated[User, Depends(require_admin)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    service: Annotated[AdminService, Depends(_admin_service)],
 ):
     """Revoke a registration code."""
-    service = AdminService(db)
     code = await service.revoke_code(code_id)
     return {"success": True, "code": code}
 
@@ -143,10 +142,9 @@ async def update_code_recipient(
     code_id: str,
     data: UpdateCodeRecipientRequest,
     admin_user: Annotated[User, Depends(require_admin)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    service: Annotated[AdminService, Depends(_admin_service)],
 ):
     """Update recipient name and email for a registration code."""
-    service = AdminService(db)
     code = await service.update_code_recipient(code_id, data.recipient_name, data.recipient_email)
     return {"success": True, "code": code}
 
@@ -154,10 +152,9 @@ async def update_code_recipient(
 @router.post("/registration-codes/validate", response_model=dict)
 async def validate_code(
     data: ValidateCodeRequest,
-    db: Annotated[AsyncSession, Depends(get_db)],
+    service: Annotated[AdminService, Depends(_admin_service)],
 ):
     """Validate a registration code (public endpoint for registration form)."""
-    service = AdminService(db)
     try:
         code = await service.validate_registration_code(data.code)
         return {
@@ -184,7 +181,7 @@ async def validate_code(
 @router.get("/users", response_model=dict)
 async def list_users(
     admin_user: Annotated[User, Depends(require_admin)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    service: Annotated[AdminService, Depends(_admin_service)],
     search: str | None = Query(None),
     status: str | None = Query("all"),
     page: int = Query(1, ge=1),
@@ -197,7 +194,6 @@ async def list_users(
         page=page,
         page_size=page_size,
     )
-    service = AdminService(db)
     users, total = await service.list_users(filters)
     return {"success": True, "users": users, "total": total}
 
@@ -206,10 +202,9 @@ async def list_users(
 async def get_user(
     user_id: str,
     admin_user: Annotated[User, Depends(require_admin)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    service: Annotated[AdminService, Depends(_admin_service)],
 ):
     """Get a specific user."""
-    service = AdminService(db)
     user = await service.get_user(user_id)
     return {"success": True, "user": user}
 
@@ -219,10 +214,9 @@ async def block_user(
     user_id: str,
     data: BlockUserRequest,
     admin_user: Annotated[User, Depends(require_admin)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    service: Annotated[AdminService, Depends(_admin_service)],
 ):
     """Block a user."""
-    service = AdminService(db)
     user = await service.block_user(user_id, data.reason, admin_user)
     return {"success": True, "user": user}
 
@@ -231,10 +225,9 @@ async def block_user(
 async def unblock_user(
     user_id: str,
     admin_user: Annotated[User, Depends(require_admin)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    service: Annotated[AdminService, Depends(_admin_service)],
 ):
     """Unblock a user."""
-    service = AdminService(db)
     user = await service.unblock_user(user_id)
     return {"success": True, "user": user}
 
@@ -244,10 +237,9 @@ async def set_partner(
     user_id: str,
     data: SetPartnerRequest,
     admin_user: Annotated[User, Depends(require_admin)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    service: Annotated[AdminService, Depends(_admin_service)],
 ):
     """Set or unset partner role for a user."""
-    service = AdminService(db)
     user = await service.set_partner(user_id, data.is_partner, admin_user)
     return {"success": True, "user": user}
 
@@ -257,10 +249,9 @@ async def update_batch(
     batch_id: str,
     data: UpdateBatchRequest,
     admin_user: Annotated[User, Depends(require_admin)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    service: Annotated[AdminService, Depends(_admin_service)],
 ):
     """Rename a batch."""
-    service = AdminService(db)
     batch = await service.update_batch(batch_id, data.name)
     return {"success": True, "batch": batch}
 
@@ -269,10 +260,9 @@ async def update_batch(
 async def delete_batch(
     batch_id: str,
     admin_user: Annotated[User, Depends(require_admin)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    service: Annotated[AdminService, Depends(_admin_service)],
 ):
     """Delete a batch and all its codes."""
-    service = AdminService(db)
     await service.delete_batch(batch_id)
     return {"success": True}
 
@@ -282,10 +272,9 @@ async def assign_batch_to_partner(
     batch_id: str,
     data: AssignPartnerRequest,
     admin_user: Annotated[User, Depends(require_admin)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    service: Annotated[AdminService, Depends(_admin_service)],
 ):
     """Assign a batch to a partner."""
-    service = AdminService(db)
     batch = await service.assign_batch_to_partner(batch_id, data.partner_id)
     return {"success": True, "batch": batch}
 
@@ -298,10 +287,9 @@ async def set_partner_type(
     user_id: str,
     data: SetPartnerTypeRequest,
     admin_user: Annotated[User, Depends(require_admin)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    service: Annotated[AdminService, Depends(_admin_service)],
 ):
     """Set the billing type for a partner."""
-    service = AdminService(db)
     user = await service.set_partner_type(user_id, data.partner_type)
     return {"success": True, "user": user}
 
@@ -312,7 +300,7 @@ async def set_partner_type(
 @router.get("/reports/activated-codes", response_model=dict)
 async def get_activated_codes_report(
     admin_user: Annotated[User, Depends(require_admin)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    service: Annotated[AdminService, Depends(_admin_service)],
     partner_id: str | None = Query(None),
     month: int | None = Query(None, ge=1, le=12),
     year: int | None = Query(None),
@@ -325,7 +313,6 @@ async def get_activated_codes_report(
         year=year,
         invoiced=invoiced,
     )
-    service = AdminService(db)
     rows = await service.get_activated_codes_report(filters)
     return {"success": True, "rows": rows}
 
@@ -334,10 +321,9 @@ async def get_activated_codes_report(
 async def invoice_codes(
     data: InvoiceCodesRequest,
     admin_user: Annotated[User, Depends(require_admin)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    service: Annotated[AdminService, Depends(_admin_service)],
 ):
     """Mark codes as invoiced."""
-    service = AdminService(db)
     count = await service.invoice_codes(data.code_ids, data.invoiced_to, data.invoice_note)
     return {"success": True, "updated": count}
 
@@ -346,10 +332,9 @@ async def invoice_codes(
 async def recognize_partner_fee(
     data: RecognizeFeeRequest,
     admin_user: Annotated[User, Depends(require_admin)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    service: Annotated[AdminService, Depends(_admin_service)],
 ):
     """Recognize partner fee for codes invoiced to client."""
-    service = AdminService(db)
     count = await service.recognize_partner_fee(data.code_ids)
     return {"success": True, "updated": count}
 
@@ -357,13 +342,12 @@ async def recognize_partner_fee(
 @router.get("/reports/billing-summary", response_model=dict)
 async def get_billing_summary(
     admin_user: Annotated[User, Depends(require_admin)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    service: Annotated[AdminService, Depends(_admin_service)],
     partner_id: str | None = Query(None),
     month: int | None = Query(None, ge=1, le=12),
     year: int | None = Query(None),
 ):
     """Get billing summary per partner."""
-    service = AdminService(db)
     summaries = await service.get_billing_summary(partner_id, month, year)
     return {"success": True, "summaries": summaries}
 
@@ -371,7 +355,7 @@ async def get_billing_summary(
 @router.get("/reports/activated-codes/export")
 async def export_activated_codes_csv(
     admin_user: Annotated[User, Depends(require_admin)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    service: Annotated[AdminService, Depends(_admin_service)],
     partner_id: str | None = Query(None),
     month: int | None = Query(None, ge=1, le=12),
     year: int | None = Query(None),
@@ -384,7 +368,6 @@ async def export_activated_codes_csv(
         year=year,
         invoiced=invoiced,
     )
-    service = AdminService(db)
     csv_content = await service.export_activated_codes_csv(filters)
 
     import io
@@ -404,10 +387,9 @@ async def set_admin(
     user_id: str,
     data: SetAdminRequest,
     admin_user: Annotated[User, Depends(require_admin)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    service: Annotated[AdminService, Depends(_admin_service)],
 ):
     """Set or unset admin role for a user."""
-    service = AdminService(db)
     user = await service.set_admin(user_id, data.is_admin, admin_user)
     return {"success": True, "user": user}
 
@@ -419,10 +401,9 @@ async def set_admin(
 async def create_billing_profile(
     data: BillingProfileCreate,
     admin_user: Annotated[User, Depends(require_admin)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    service: Annotated[AdminService, Depends(_admin_service)],
 ):
     """Create a new billing profile."""
-    service = AdminService(db)
     profile = await service.create_billing_profile(data)
     return {"success": True, "profile": profile}
 
@@ -430,10 +411,9 @@ async def create_billing_profile(
 @router.get("/billing-profiles", response_model=dict)
 async def list_billing_profiles(
     admin_user: Annotated[User, Depends(require_admin)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    service: Annotated[AdminService, Depends(_admin_service)],
 ):
     """List all billing profiles."""
-    service = AdminService(db)
     result = await service.list_billing_profiles()
     return {"success": True, "profiles": result.profiles, "total": result.total}
 
@@ -442,10 +422,9 @@ async def list_billing_profiles(
 async def get_billing_profile(
     profile_id: str,
     admin_user: Annotated[User, Depends(require_admin)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    service: Annotated[AdminService, Depends(_admin_service)],
 ):
     """Get a billing profile with linked users."""
-    service = AdminService(db)
     profile = await service.get_billing_profile(profile_id)
     return {"success": True, "profile": profile}
 
@@ -455,10 +434,9 @@ async def update_billing_profile(
     profile_id: str,
     data: BillingProfileUpdate,
     admin_user: Annotated[User, Depends(require_admin)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    service: Annotated[AdminService, Depends(_admin_service)],
 ):
     """Update a billing profile."""
-    service = AdminService(db)
     profile = await service.update_billing_profile(profile_id, data)
     return {"success": True, "profile": profile}
 
@@ -467,10 +445,9 @@ async def update_billing_profile(
 async def delete_billing_profile(
     profile_id: str,
     admin_user: Annotated[User, Depends(require_admin)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    service: Annotated[AdminService, Depends(_admin_service)],
 ):
     """Delete a billing profile (only if no users linked)."""
-    service = AdminService(db)
     await service.delete_billing_profile(profile_id)
     return {"success": True}
 
@@ -483,10 +460,9 @@ async def set_user_billing_profile(
     user_id: str,
     data: SetBillingProfileRequest,
     admin_user: Annotated[User, Depends(require_admin)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    service: Annotated[AdminService, Depends(_admin_service)],
 ):
     """Associate or dissociate a user with a billing profile."""
-    service = AdminService(db)
     user = await service.set_user_billing_profile(
         user_id, data.billing_profile_id, data.is_billing_master
     )
@@ -498,10 +474,9 @@ async def set_max_records_free(
     user_id: str,
     data: SetMaxRecordsFreeRequest,
     admin_user: Annotated[User, Depends(require_admin)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    service: Annotated[AdminService, Depends(_admin_service)],
 ):
     """Set max records for a free user."""
-    service = AdminService(db)
     user = await service.set_max_records_free(user_id, data.max_records_free)
     return {"success": True, "user": user}
 
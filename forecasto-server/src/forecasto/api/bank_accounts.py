@@ -16,6 +16,7 @@ from forecasto.models.user import User
 from forecasto.models.workspace import Workspace, WorkspaceMember
 from forecasto.schemas.bank_account import (
     BalanceCreate,
+    BalanceListResponse,
     BalanceResponse,
     BankAccountCreate,
     BankAccountResponse,
@@ -23,6 +24,7 @@ from forecasto.schemas.bank_account import (
 )
 from forecasto.services.bank_account_service import BankAccountService
 from forecasto.services.event_bus import event_bus
+from forecasto.utils.responses import ORJSONResponse
 
 # User-level router (mounted at /api/v1/bank-accounts)
 user_router = APIRouter()
@@ -208,7 +210,11 @@ async def remove_workspace_bank_account(
 
 # --- Balance endpoints (kept on workspace router for backward compat) ---
 
-@router.get("/{workspace_id}/bank-accounts/{account_id}/balances", response_model=dict)
+@router.get(
+    "/{workspace_id}/bank-accounts/{account_id}/balances",
+    response_model=BalanceListResponse,
+    response_class=ORJSONResponse,
+)
 async def get_balances(
     workspace_id: str,
     account_id: str,
@@ -222,10 +228,8 @@ async def get_balances(
     """Get balance history for an account."""
     service = BankAccountService(db)
     balances = await service.get_balances(account_id, from_date, to_date)
-    return {
-        "success": True,
-        "balances": [BalanceResponse.model_validate(b) for b in balances],
-    }
+    # Rows already match BalanceResponse; orjson formats them without a pydantic pass
+    return ORJSONResponse({"success": True, "balances": [dict(row) for row in balances]})
 
 @router.post(
     "/{workspace_id}/bank-accounts/{account_id}/balances",
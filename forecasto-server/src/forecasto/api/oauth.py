@@ -7,7 +7,7 @@ Endpoints are mounted at /oauth (no /api/v1 prefix, per OAuth convention).
 from __future__ import annotations
 
 from typing import Annotated, Optional
-from urllib.parse import urlencode
+from urllib.parse import quote_plus
 
 from fastapi import APIRouter, Depends, Form, Query, Request
 from fastapi.responses import HTMLResponse, JSONResponse, RedirectResponse
@@ -23,6 +23,16 @@ from forecasto.services.oauth_service import OAuthService
 router = APIRouter()
 
 
+def _oauth_service(db: AsyncSession = Depends(get_db)) -> OAuthService:
+    """Dependency: one OAuthService per request (cached by FastAPI)."""
+    return OAuthService(db)
+
+
+def _auth_service(db: AsyncSession = Depends(get_db)) -> AuthService:
+    """Dependency: one AuthService per request (cached by FastAPI)."""
+    return AuthService(db)
+
+
 def _base_url(request: Request) -> str:
     """Return the scheme+host of the current request (e.g. https://app.forecasto.it)."""
     return str(request.base_url).rstrip("/")
@@ -121,10 +131,9 @@ async def authorize_get(
     state: str = Query(""),
     code_challenge: Optional[str] = Query(None),
     code_challenge_method: Optional[str] = Query(None),
-    db: AsyncSession = Depends(get_db),
+    oauth: OAuthService = Depends(_oauth_service),
 ):
     """Show the Forecasto login form to authorize the OAuth client."""
-    oauth = OAuthService(db)
     try:
         client = await oauth.validate_client_redirect(client_id, redirect_uri)
     except (ValidationException, Exception):
@@ -158,11 +167,9 @@ async def authorize_post(
     code_challenge_method: str = Form(""),
     email: str = Form(...),
     password: str = Form(...),
-    db: AsyncSession = Depends(get_db),
+    oauth: OAuthService = Depends(_oauth_service),
 ):
     """Process login form, issue auth code, redirect back to client."""
-    oauth = OAuthService(db)
-
     # Validate client/redirect first
     try:
         client = await oauth.validate_client_redirect(client_id, redirect_uri)
@@ -197,12 +204,13 @@ async def authorize_post(
         code_challenge_method=code_challenge_method or None,
     )
 
-    # Redirect back to client with code + state
-    params = {"code": auth_code}
+    # Redirect back to client with code + state. The code comes from
+    # secrets.token_urlsafe, so it is already URL-safe and needs no escaping.
+    sep = "&" if "?" in redirect_uri else "?"
+    query = "code=" + auth_code
     if state:
-        params["state"] = state
-    redirect_url = f"{redirect_uri}?{urlencode(params)}"
-    return RedirectResponse(redirect_url, status_code=302)
+        query += "&state=" + quote_plus(state)
+    return RedirectResponse(redirect_uri + sep + query, status_code=302)
 
 
 # ---------------------------------------------------------------------------
@@ -217,7 +225,8 @@ async def token(
     client_id: Optional[str] = Form(None),
     code_verifier: Optional[str] = Form(None),
     refresh_token: Optional[str] = Form(None),
-    db: AsyncSession = Depends(get_db),
+    oauth: OAuthService = Depends(_oauth_service),
+    auth_service: AuthService = Depends(_auth_service),
 ):
     """Exchange authorization code or refresh token for access + refresh tokens."""
     if grant_type == "authorization_code":
@@ -226,7 +235,6 @@ async def token(
                 {"error": "invalid_request", "error_description": "code, redirect_uri, client_id required"},
                 status_code=400,
             )
-        oauth = OAuthService(db)
         try:
             tokens = await oauth.exchange_code_for_tokens(
                 code=code,
@@ -247,7 +255,6 @@ async def token(
                 {"error": "invalid_request", "error_description": "refresh_token required"},
                 status_code=400,
             )
-        auth_service = AuthService(db)
         try:
             result = await auth_service.refresh_token(refresh_token)
             return {
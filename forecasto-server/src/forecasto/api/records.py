@@ -6,33 +6,55 @@ from __future__ import annotations
 from datetime import date
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, Query
+import orjson
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from forecasto.database import get_db
 from forecasto.dependencies import (
+    WorkspaceContext,
     check_area_permission,
+    check_export_permission,
+    check_import_permission,
+    check_import_sdi_permission,
     get_current_user,
     get_current_workspace,
+    get_readable_areas,
 )
+from forecasto.exceptions import NotFoundException
+from forecasto.models.record import Record
 from forecasto.models.user import User
-from forecasto.models.workspace import Workspace, WorkspaceMember
+from forecasto.models.workspace import WorkspaceMember
 from forecasto.schemas.record import (
     BulkDeleteRequest,
     RecordCreate,
+    RecordDetailResponse,
     RecordFilter,
+    RecordListResponse,
     RecordResponse,
     RecordUpdate,
     SendReminderRequest,
 )
+from forecasto.services import prompt_auto_regen
 from forecasto.services.event_bus import event_bus
 from forecasto.services.record_service import RecordService
+from forecasto.utils.responses import ORJSONResponse
 
 router = APIRouter()
 
-def _record_to_response(record, is_draft: bool = False) -> RecordResponse:
-    """Convert record model to response schema, enriching with audit user info."""
-    response = RecordResponse.model_validate(record)
+# Built once at import: serializes a whole record list in a single pydantic-core pass.
+_RECORD_LIST_ADAPTER = TypeAdapter(list[RecordResponse])
+
+def _record_service(db: Annotated[AsyncSession, Depends(get_db)]) -> RecordService:
+    """Dependency: one RecordService per request (cached by FastAPI)."""
+    return RecordService(db)
+
+def _enrich_response(response: RecordResponse, record, is_draft: bool = False) -> RecordResponse:
+    """Fill the response fields derived from the record's audit/bank relations."""
     response.is_draft = is_draft
     response.creator_email = record.creator.email if record.creator else None
     response.updater_email = record.updater.email if record.updater else None
@@ -40,14 +62,29 @@ def _record_to_response(record, is_draft: bool = False) -> RecordResponse:
     response.bank_account_name = record.bank_account.name if record.bank_account else None
     return response
 
-@router.get("/{workspace_id}/records", response_model=dict)
+def _record_to_response(record, is_draft: bool = False) -> RecordResponse:
+    """Convert record model to response schema, enriching with audit user info."""
+    return _enrich_response(RecordResponse.model_validate(record), record, is_draft)
+
+def _records_to_payload(records: list) -> list[dict]:
+    """Validate and serialize a list of records with the shared list adapter.
+
+    Validation and serialization each cross into pydantic-core once for the
+    whole list instead of once per record.
+    """
+    responses = _RECORD_LIST_ADAPTER.validate_python(records, from_attributes=True)
+    for response, record in zip(responses, records):
+        _enrich_response(response, record, getattr(record, "_draft", False))
+    return _RECORD_LIST_ADAPTER.dump_python(responses, mode="json")
+
+@router.get(
+    "/{workspace_id}/records", response_model=RecordListResponse, response_class=ORJSONResponse
+)
 async def list_records(
     workspace_id: str,
-    workspace_data: Annotated[
-        tuple[Workspace, WorkspaceMember], Depends(get_current_workspace)
-    ],
+    workspace_data: Annotated[WorkspaceContext, Depends(get_current_workspace)],
     current_user: Annotated[User, Depends(get_current_user)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    service: Annotated[RecordService, Depends(_record_service)],
     area: str | None = Query(None),
     stage: str | None = Query(None),
     date_start: date | None = Query(None),
@@ -61,9 +98,15 @@ async def list_records(
     include_deleted: bool = Query(False),
     limit: int | None = Query(None, ge=1, le=1000),
     offset: int = Query(0, ge=0),
+    after: str | None = Query(None, description="Keyset cursor (next_cursor of the previous page)"),
 ):
-    """List records with filters and optional pagination."""
-    workspace, member = workspace_data
+    """List records with filters and optional pagination.
+
+    With ``limit`` set, pages can be walked either by ``offset`` or by passing
+    the returned ``next_cursor`` as ``after``. The cursor mode seeks directly
+    to the next page and skips the total count (``total_records`` is null).
+    """
+    member = workspace_data.member
 
     # Validate date_field
     if date_field not in ("date_cashflow", "date_offer", "date_document"):
@@ -73,9 +116,8 @@ async def list_records(
     if area:
         check_area_permission(member, area, "read")
 
-    service = RecordService(db)
-
-    filters = RecordFilter(
+    # Query params are already validated by FastAPI; skip re-validation
+    filters = RecordFilter.model_construct(
         area=area,
         stage=stage,
         date_start=date_start,
@@ -89,37 +131,45 @@ async def list_records(
         include_deleted=include_deleted,
     )
 
-    # Pass member and current_user_id for granular permission filtering
-    records, total = await service.list_records(
+    if after is not None:
+        page_size = limit or 1000
+        records, next_cursor = await service.list_records_after(
+            workspace_id, filters, after, page_size, member=member,
+            current_user_id=current_user.id, readable_areas=get_readable_areas(member),
+        )
+        return ORJSONResponse({
+            "success": True,
+            "records": _records_to_payload(records),
+            "total_records": None,
+            "limit": page_size,
+            "has_more": next_cursor is not None,
+            "next_cursor": next_cursor,
+        })
+
+    # Pass member and current_user_id for granular permission filtering;
+    # readable areas are filtered in SQL so total/pagination stay consistent.
+    records, total, next_cursor = await service.list_records(
         workspace_id, filters, member=member, current_user_id=current_user.id,
-        limit=limit, offset=offset,
+        limit=limit, offset=offset, readable_areas=get_readable_areas(member),
     )
 
-    # Filter by readable areas if no specific area
-    if not area:
-        readable_areas = [
-            a for a, perm in member.area_permissions.items() if perm != "none"
-        ]
-        records = [r for r in records if r.area in readable_areas]
-
     result = {
         "success": True,
-        "records": [_record_to_response(r, getattr(r, "_draft", False)) for r in records],
+        "records": _records_to_payload(records),
         "total_records": total,
     }
     if limit is not None:
         result["limit"] = limit
         result["offset"] = offset
-        result["has_more"] = (offset + len(records)) < total
-    return result
+        result["has_more"] = next_cursor is not None
+        result["next_cursor"] = next_cursor
+    return ORJSONResponse(result)
 
 @router.get("/{workspace_id}/records/field-values", response_model=dict)
 async def get_field_values(
     workspace_id: str,
-    workspace_data: Annotated[
-        tuple[Workspace, WorkspaceMember], Depends(get_current_workspace)
-    ],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    workspace_data: Annotated[WorkspaceContext, Depends(get_current_workspace)],
+    service: Annotated[RecordService, Depends(_record_service)],
     field: str = Query(..., description="Campo: account, reference, project_code, owner, nextaction"),
     q: str | None = Query(None, description="Stringa di ricerca opzionale"),
     limit: int = Query(20, ge=1, le=100),
@@ -129,48 +179,41 @@ async def get_field_values(
     """Return distinct values for a field in the workspace (autocomplete)."""
     allowed = {"account", "reference", "project_code", "owner", "nextaction"}
     if field not in allowed:
-        from fastapi import HTTPException
         raise HTTPException(status_code=400, detail=f"Field '{field}' not supported. Allowed: {sorted(allowed)}")
 
-    service = RecordService(db)
     values = await service.get_field_values(workspace_id, field, q=q, limit=limit, sign=sign, account_filter=account_filter)
     return {"success": True, "values": values}
 
 
-@router.post("/{workspace_id}/records", response_model=dict, status_code=201)
+@router.post("/{workspace_id}/records", response_model=RecordDetailResponse, status_code=201)
 async def create_record(
     workspace_id: str,
     data: RecordCreate,
-    workspace_data: Annotated[
-        tuple[Workspace, WorkspaceMember], Depends(get_current_workspace)
-    ],
+    workspace_data: Annotated[WorkspaceContext, Depends(get_current_workspace)],
     current_user: Annotated[User, Depends(get_current_user)],
     db: Annotated[AsyncSession, Depends(get_db)],
+    service: Annotated[RecordService, Depends(_record_service)],
 ):
     """Create a new record."""
-    workspace, member = workspace_data
+    member = workspace_data.member
     check_area_permission(member, data.area, "write")
 
-    service = RecordService(db)
     # Pass member for granular permission check
     record = await service.create_record(workspace_id, data, current_user, member=member)
 
     # Re-fetch with eager-loaded relationships to avoid lazy-load MissingGreenlet
     # (async SQLAlchemy does not support lazy loading; bank_account and audit relations
     # must be explicitly loaded before _record_to_response accesses them)
-    from sqlalchemy import select as sa_select
-    from forecasto.models.record import Record as RecordModel
     await db.flush()
     result = await db.execute(
-        sa_select(RecordModel)
+        select(Record)
         .options(*service._audit_options)
-        .where(RecordModel.id == record.id)
+        .where(Record.id == record.id)
     )
     record = result.scalar_one()
 
     await event_bus.publish("records_changed", workspace_id, {"action": "create"})
 
-    from forecasto.services import prompt_auto_regen
     await prompt_auto_regen.increment_workspace_record_counter(workspace_id, db, count=1)
     await prompt_auto_regen.maybe_trigger_workspace_regen(workspace_id, db)
 
@@ -180,141 +223,115 @@ async def create_record(
     }
 
 
-@router.post("/{workspace_id}/records/bulk-import", response_model=dict, status_code=201)
-async def bulk_import_records(
+async def _bulk_import(
     workspace_id: str,
     records: list[RecordCreate],
-    workspace_data: Annotated[
-        tuple[Workspace, WorkspaceMember], Depends(get_current_workspace)
-    ],
-    current_user: Annotated[User, Depends(get_current_user)],
-    db: Annotated[AsyncSession, Depends(get_db)],
-):
-    """Bulk import records from JSON with import permission checks."""
-    workspace, member = workspace_data
-
-    from forecasto.dependencies import check_import_permission
-
-    # Check import permission once (workspace-level)
-    check_import_permission(member)
-
-    # Validate area write permissions for all records
-    for data in records:
-        check_area_permission(member, data.area, "write")
-
-    # Demo workspaces bypass the record-count check on bulk-import:
-    # the seed payload is the source of truth for the demo content.
-    is_demo_workspace = bool((workspace.settings or {}).get("is_demo"))
-
-    # Import all records
-    service = RecordService(db)
-    created_ids = []
-    for data in records:
-        record = await service.create_record(
-            workspace_id,
-            data,
-            current_user,
-            member=member,
-            skip_limit_check=is_demo_workspace,
-        )
-        created_ids.append(record.id)
+    member: WorkspaceMember,
+    current_user: User,
+    db: AsyncSession,
+    service: RecordService,
+    skip_limit_check: bool = False,
+) -> dict:
+    """Shared body of the bulk-import endpoints (import permission already checked)."""
+    # Validate area write permissions once per distinct area
+    for area in {data.area for data in records}:
+        check_area_permission(member, area, "write")
+
+    # Import all records in one batched insert
+    inserted = await service.create_records_bulk(
+        workspace_id,
+        records,
+        current_user,
+        member=member,
+        skip_limit_check=skip_limit_check,
+    )
+    created_ids = [r.id for r in inserted]
 
     # Re-fetch with eager-loaded relationships to avoid lazy-load MissingGreenlet
     await db.flush()
-    from sqlalchemy import select as sa_select
-    from forecasto.models.record import Record as RecordModel
     result = await db.execute(
-        sa_select(RecordModel)
+        select(Record)
         .options(*service._audit_options)
-        .where(RecordModel.id.in_(created_ids))
+        .where(Record.id.in_(created_ids))
     )
     created = list(result.scalars().all())
 
     await event_bus.publish("records_changed", workspace_id, {"action": "bulk_create"})
 
-    from forecasto.services import prompt_auto_regen
     await prompt_auto_regen.increment_workspace_record_counter(workspace_id, db, count=len(created))
     await prompt_auto_regen.maybe_trigger_workspace_regen(workspace_id, db)
 
     return {
         "success": True,
-        "records": [_record_to_response(r) for r in created],
+        "records": _records_to_payload(created),
         "total": len(created)
     }
 
 
-@router.post("/{workspace_id}/records/bulk-import-sdi", response_model=dict, status_code=201)
-async def bulk_import_sdi_records(
+@router.post("/{workspace_id}/records/bulk-import", response_model=dict, status_code=201)
+async def bulk_import_records(
     workspace_id: str,
     records: list[RecordCreate],
-    workspace_data: Annotated[
-        tuple[Workspace, WorkspaceMember], Depends(get_current_workspace)
-    ],
+    workspace_data: Annotated[WorkspaceContext, Depends(get_current_workspace)],
     current_user: Annotated[User, Depends(get_current_user)],
     db: Annotated[AsyncSession, Depends(get_db)],
+    service: Annotated[RecordService, Depends(_record_service)],
 ):
-    """Bulk import SDI invoices with SDI-specific permission checks."""
+    """Bulk import records from JSON with import permission checks."""
     workspace, member = workspace_data
 
-    from forecasto.dependencies import check_import_sdi_permission
-
-    # Check SDI import permission once (workspace-level)
-    check_import_sdi_permission(member)
-
-    # Validate area write permissions for all records
-    for data in records:
-        check_area_permission(member, data.area, "write")
+    # Check import permission once (workspace-level)
+    check_import_permission(member)
 
-    # Import all records
-    service = RecordService(db)
-    created_ids = []
-    for data in records:
-        record = await service.create_record(workspace_id, data, current_user, member=member)
-        created_ids.append(record.id)
+    # Demo workspaces bypass the record-count check on bulk-import:
+    # the seed payload is the source of truth for the demo content.
+    is_demo_workspace = bool((workspace.settings or {}).get("is_demo"))
 
-    # Re-fetch with eager-loaded relationships to avoid lazy-load MissingGreenlet
-    await db.flush()
-    from sqlalchemy import select as sa_select
-    from forecasto.models.record import Record as RecordModel
-    result = await db.execute(
-        sa_select(RecordModel)
-        .options(*service._audit_options)
-        .where(RecordModel.id.in_(created_ids))
+    return await _bulk_import(
+        workspace_id, records, member, current_user, db, service,
+        skip_limit_check=is_demo_workspace,
     )
-    created = list(result.scalars().all())
 
-    await event_bus.publish("records_changed", workspace_id, {"action": "bulk_create"})
 
-    from forecasto.services import prompt_auto_regen
-    await prompt_auto_regen.increment_workspace_record_counter(workspace_id, db, count=len(created))
-    await prompt_auto_regen.maybe_trigger_workspace_regen(workspace_id, db)
+@router.post("/{workspace_id}/records/bulk-import-sdi", response_model=dict, status_code=201)
+async def bulk_import_sdi_records(
+    workspace_id: str,
+    records: list[RecordCreate],
+    workspace_data: Annotated[WorkspaceContext, Depends(get_current_workspace)],
+    current_user: Annotated[User, Depends(get_current_user)],
+    db: Annotated[AsyncSession, Depends(get_db)],
+    service: Annotated[RecordService, Depends(_record_service)],
+):
+    """Bulk import SDI invoices with SDI-specific permission checks."""
+    member = workspace_data.member
 
-    return {
-        "success": True,
-        "records": [_record_to_response(r) for r in created],
-        "total": len(created)
-    }
+    # Check SDI import permission once (workspace-level)
+    check_import_sdi_permission(member)
+
+    return await _bulk_import(workspace_id, records, member, current_user, db, service)
 
 
 @router.delete("/{workspace_id}/records/bulk", response_model=dict)
 async def bulk_delete_records(
     workspace_id: str,
     body: BulkDeleteRequest,
-    workspace_data: Annotated[
-        tuple[Workspace, WorkspaceMember], Depends(get_current_workspace)
-    ],
+    workspace_data: Annotated[WorkspaceContext, Depends(get_current_workspace)],
     current_user: Annotated[User, Depends(get_current_user)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    service: Annotated[RecordService, Depends(_record_service)],
 ):
     """Soft delete multiple records with a single SSE event at the end."""
-    workspace, member = workspace_data
-    service = RecordService(db)
+    member = workspace_data.member
+
+    # One query for all records; area checks hit the member's cached area sets
+    records = await service.get_records_by_id(body.ids, workspace_id)
 
     deleted = 0
     errors: list[dict] = []
     for rid in body.ids:
         try:
-            record = await service.get_record(rid, workspace_id)
+            record = records.get(rid)
+            if record is None:
+                raise NotFoundException(f"Record {rid} not found")
             check_area_permission(member, record.area, "write")
             await service.delete_record(record, current_user, member=member)
             deleted += 1
@@ -334,40 +351,90 @@ async def bulk_delete_records(
     }
 
 
-@router.get("/{workspace_id}/records/{record_id}", response_model=dict)
+@router.get("/{workspace_id}/records/export", response_class=ORJSONResponse)
+async def export_records(
+    workspace_id: str,
+    workspace_data: Annotated[WorkspaceContext, Depends(get_current_workspace)],
+    current_user: Annotated[User, Depends(get_current_user)],
+    service: Annotated[RecordService, Depends(_record_service)],
+    area: str | None = Query(None),
+    date_start: date | None = Query(None),
+    date_end: date | None = Query(None),
+    date_field: str = Query("date_cashflow"),
+    format: str = Query("json", pattern="^(json|ndjson)$"),
+):
+    """Export records with export permission checks.
+
+    ``format=ndjson`` streams one JSON record per line with bounded memory;
+    the default returns the whole export as a single JSON document.
+    """
+    member = workspace_data.member
+
+    if date_field not in ("date_cashflow", "date_offer", "date_document"):
+        date_field = "date_cashflow"
+
+    # Check export permission once (workspace-level)
+    check_export_permission(member)
+
+    # Fetch records (restricted in SQL to the areas the member can read)
+    filters = RecordFilter.model_construct(
+        area=area,
+        date_start=date_start,
+        date_end=date_end,
+        date_field=date_field,
+    )
+
+    if format == "ndjson":
+        batches = service.stream_records(
+            workspace_id, filters, member=member, current_user_id=current_user.id,
+            readable_areas=get_readable_areas(member),
+        )
+
+        async def ndjson_lines():
+            async for batch in batches:
+                yield b"".join(orjson.dumps(r) + b"\n" for r in _records_to_payload(batch))
+
+        return StreamingResponse(ndjson_lines(), media_type="application/x-ndjson")
+
+    records, _, _ = await service.list_records(
+        workspace_id, filters, member=member, current_user_id=current_user.id,
+        readable_areas=get_readable_areas(member),
+    )
+
+    return ORJSONResponse({
+        "success": True,
+        "records": _records_to_payload(records),
+        "total": len(records),
+    })
+
+@router.get("/{workspace_id}/records/{record_id}", response_model=RecordDetailResponse)
 async def get_record(
     workspace_id: str,
     record_id: str,
-    workspace_data: Annotated[
-        tuple[Workspace, WorkspaceMember], Depends(get_current_workspace)
-    ],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    workspace_data: Annotated[WorkspaceContext, Depends(get_current_workspace)],
+    service: Annotated[RecordService, Depends(_record_service)],
 ):
     """Get record details."""
-    workspace, member = workspace_data
+    member = workspace_data.member
 
-    service = RecordService(db)
     record = await service.get_record(record_id, workspace_id)
 
     check_area_permission(member, record.area, "read")
 
     return {"success": True, "record": _record_to_response(record)}
 
-@router.patch("/{workspace_id}/records/{record_id}", response_model=dict)
+@router.patch("/{workspace_id}/records/{record_id}", response_model=RecordDetailResponse)
 async def update_record(
     workspace_id: str,
     record_id: str,
     data: RecordUpdate,
-    workspace_data: Annotated[
-        tuple[Workspace, WorkspaceMember], Depends(get_current_workspace)
-    ],
+    workspace_data: Annotated[WorkspaceContext, Depends(get_current_workspace)],
     current_user: Annotated[User, Depends(get_current_user)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    service: Annotated[RecordService, Depends(_record_service)],
 ):
     """Update a record."""
-    workspace, member = workspace_data
+    member = workspace_data.member
 
-    service = RecordService(db)
     record = await service.get_record(record_id, workspace_id)
 
     check_area_permission(member, record.area, "write")
@@ -383,17 +450,15 @@ async def update_record(
 async def delete_record(
     workspace_id: str,
     record_id: str,
-    workspace_data: Annotated[
-        tuple[Workspace, WorkspaceMember], Depends(get_current_workspace)
-    ],
+    workspace_data: Annotated[WorkspaceContext, Depends(get_current_workspace)],
     current_user: Annotated[User, Depends(get_current_user)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    service: Annotated[RecordService, Depends(_record_service)],
 ):
     """Soft delete a record."""
-    workspace, member = workspace_data
+    member = workspace_data.member
 
-    service = RecordService(db)
-    record = await service.get_record(record_id, workspace_id)
+    # The response carries no record, so skip the audit relationship loads
+    record = await service.get_record(record_id, workspace_id, with_audit=False)
 
     check_area_permission(member, record.area, "write")
 
@@ -405,32 +470,26 @@ async def delete_record(
     return {"success": True, "message": "Record deleted"}
 
 
-@router.post("/{workspace_id}/records/{record_id}/restore", response_model=dict)
+@router.post("/{workspace_id}/records/{record_id}/restore", response_model=RecordDetailResponse)
 async def restore_record(
     workspace_id: str,
     record_id: str,
-    workspace_data: Annotated[
-        tuple[Workspace, WorkspaceMember], Depends(get_current_workspace)
-    ],
+    workspace_data: Annotated[WorkspaceContext, Depends(get_current_workspace)],
     current_user: Annotated[User, Depends(get_current_user)],
     db: Annotated[AsyncSession, Depends(get_db)],
+    service: Annotated[RecordService, Depends(_record_service)],
 ):
     """Restore a soft-deleted record."""
-    workspace, member = workspace_data
+    member = workspace_data.member
 
-    service = RecordService(db)
     # Fetch including deleted records
-    from forecasto.models.record import Record as RecordModel
-    from sqlalchemy import select as sa_select
-    from sqlalchemy.orm import selectinload
     result = await db.execute(
-        sa_select(RecordModel)
+        select(Record)
         .options(*service._audit_options)
-        .where(RecordModel.id == record_id, RecordModel.workspace_id == workspace_id)
+        .where(Record.id == record_id, Record.workspace_id == workspace_id)
     )
     record = result.scalar_one_or_none()
     if not record:
-        from forecasto.exceptions import NotFoundException
         raise NotFoundException(f"Record {record_id} not found")
 
     check_area_permission(member, record.area, "write")
@@ -445,24 +504,21 @@ async def restore_record(
 async def send_reminder(
     workspace_id: str,
     body: SendReminderRequest,
-    workspace_data: Annotated[
-        tuple[Workspace, WorkspaceMember], Depends(get_current_workspace)
-    ],
+    workspace_data: Annotated[WorkspaceContext, Depends(get_current_workspace)],
     current_user: Annotated[User, Depends(get_current_user)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    service: Annotated[RecordService, Depends(_record_service)],
 ):
     """Invia promemoria (count=-1 → 0) o sollecito (count>=0 → +1, data spostata)."""
-    workspace, member = workspace_data
+    member = workspace_data.member
     check_area_permission(member, "actual", "write")
 
-    service = RecordService(db)
     updated = await service.send_reminders(workspace_id, body.record_ids, current_user)
 
     await event_bus.publish("records_changed", workspace_id, {"action": "send_reminder"})
 
     return {
         "success": True,
-        "updated": [_record_to_response(r) for r in updated],
+        "updated": _records_to_payload(updated),
     }
 
 
@@ -470,78 +526,19 @@ async def send_reminder(
 async def undo_reminder(
     workspace_id: str,
     body: SendReminderRequest,
-    workspace_data: Annotated[
-        tuple[Workspace, WorkspaceMember], Depends(get_current_workspace)
-    ],
+    workspace_data: Annotated[WorkspaceContext, Depends(get_current_workspace)],
     current_user: Annotated[User, Depends(get_current_user)],
-    db: Annotated[AsyncSession, Depends(get_db)],
+    service: Annotated[RecordService, Depends(_record_service)],
 ):
     """Annulla l'ultimo promemoria/sollecito (rollback count + data)."""
-    workspace, member = workspace_data
+    member = workspace_data.member
     check_area_permission(member, "actual", "write")
 
-    service = RecordService(db)
     updated = await service.undo_reminder(workspace_id, body.record_ids, current_user)
 
     await event_bus.publish("records_changed", workspace_id, {"action": "undo_reminder"})
 
     return {
         "success": True,
-        "updated": [_record_to_response(r) for r in updated],
-    }
-
-
-@router.get("/{workspace_id}/records/export", response_model=dict)
-async def export_records(
-    workspace_id: str,
-    workspace_data: Annotated[
-        tuple[Workspace, WorkspaceMember], Depends(get_current_workspace)
-    ],
-    current_user: Annotated[User, Depends(get_current_user)],
-    db: Annotated[AsyncSession, Depends(get_db)],
-    area: str | None = Query(None),
-    date_start: date | None = Query(None),
-    date_end: date | None = Query(None),
-    date_field: str = Query("date_cashflow"),
-):
-    """Export records with export permission checks."""
-    workspace, member = workspace_data
-
-    if date_field not in ("date_cashflow", "date_offer", "date_document"):
-        date_field = "date_cashflow"
-
-    from forecasto.dependencies import check_export_permission
-
-    # Check export permission once (workspace-level)
-    check_export_permission(member)
-
-    # Determine areas to export
-    if area:
-        areas_to_export = [area]
-    else:
-        # Export all readable areas
-        areas_to_export = [
-            a for a, perm in member.area_permissions.items() if perm != "none"
-        ]
-
-    # Fetch records
-    service = RecordService(db)
-    filters = RecordFilter(
-        area=area,
-        date_start=date_start,
-        date_end=date_end,
-        date_field=date_field,
-    )
-
-    records = await service.list_records(
-        workspace_id, filters, member=member, current_user_id=current_user.id
-    )
-
-    # Filter by exportable areas
-    exportable_records = [r for r in records if r.area in areas_to_export]
-
-    return {
-        "success": True,
-        "records": [_record_to_response(r) for r in exportable_records],
-        "total": len(exportable_records),
+        "updated": _records_to_payload(updated),
     }
@@ -6,35 +6,44 @@ from __future__ import annotations
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, Query
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from forecasto.database import get_db
-from forecasto.dependencies import get_current_user, get_current_workspace
+from forecasto.dependencies import WorkspaceContext, get_current_user, get_current_workspace
 from forecasto.models.user import User
-from forecasto.models.workspace import Workspace, WorkspaceMember
 from forecasto.schemas.session import (
+    AddMessageResponse,
     CommitRequest,
     CommitResponse,
     DiscardResponse,
     MessageCreate,
+    MessageListResponse,
     MessageResponse,
-    OperationResponse,
+    OperationListResponse,
     RedoResponse,
     ResolveConflictsRequest,
     SessionCreate,
+    SessionDetailResponse,
+    SessionListResponse,
     SessionResponse,
     UndoResponse,
 )
 from forecasto.services.session_service import SessionService
+from forecasto.utils.responses import ORJSONResponse, list_envelope
 
 router = APIRouter()
 
-@router.get("/{workspace_id}/sessions", response_model=dict)
+# List serializers built once at import; list endpoints return pre-serialized JSON.
+_SESSION_LIST_ADAPTER = TypeAdapter(list[SessionResponse])
+_MESSAGE_LIST_ADAPTER = TypeAdapter(list[MessageResponse])
+
+@router.get(
+    "/{workspace_id}/sessions", response_model=SessionListResponse, response_class=ORJSONResponse
+)
 async def list_sessions(
     workspace_id: str,
-    workspace_data: Annotated[
-        tuple[Workspace, WorkspaceMember], Depends(get_current_workspace)
-    ],
+    workspace_data: Annotated[WorkspaceContext, Depends(get_current_workspace)],
     db: Annotated[AsyncSession, Depends(get_db)],
     status: str | None = Query(None),
     user_id: str | None = Query(None),
@@ -45,17 +54,15 @@ async def list_sessions(
     sessions = await service.list_sessions(workspace_id, status, user_id)
 
     # User relationship is eagerly loaded by service, use Pydantic auto-mapping
-    session_responses = [SessionResponse.model_validate(s) for s in sessions]
+    session_responses = _SESSION_LIST_ADAPTER.validate_python(sessions, from_attributes=True)
 
-    return {"success": True, "sessions": session_responses}
+    return list_envelope("sessions", _SESSION_LIST_ADAPTER.dump_json(session_responses))
 
-@router.post("/{workspace_id}/sessions", response_model=dict, status_code=201)
+@router.post("/{workspace_id}/sessions", response_model=SessionDetailResponse, status_code=201)
 async def create_session(
     workspace_id: str,
     data: SessionCreate,
-    workspace_data: Annotated[
-        tuple[Workspace, WorkspaceMember], Depends(get_current_workspace)
-    ],
+    workspace_data: Annotated[WorkspaceContext, Depends(get_current_workspace)],
     current_user: Annotated[User, Depends(get_current_user)],
     db: Annotated[AsyncSession, Depends(get_db)],
 ):
@@ -68,13 +75,11 @@ async def create_session(
         "session": SessionResponse.model_validate(session),
     }
 
-@router.get("/{workspace_id}/sessions/{session_id}", response_model=dict)
+@router.get("/{workspace_id}/sessions/{session_id}", response_model=SessionDetailResponse)
 async def get_session(
     workspace_id: str,
     session_id: str,
-    workspace_data: Annotated[
-        tuple[Workspace, WorkspaceMember], Depends(get_current_workspace)
-    ],
+    workspace_data: Annotated[WorkspaceContext, Depends(get_current_workspace)],
     db: Annotated[AsyncSession, Depends(get_db)],
 ):
     """Get session details."""
@@ -86,69 +91,65 @@ async def get_session(
         "session": SessionResponse.model_validate(session),
     }
 
-@router.get("/{workspace_id}/sessions/{session_id}/messages", response_model=dict)
+@router.get(
+    "/{workspace_id}/sessions/{session_id}/messages",
+    response_model=MessageListResponse,
+    response_class=ORJSONResponse,
+)
 async def get_messages(
     workspace_id: str,
     session_id: str,
-    workspace_data: Annotated[
-        tuple[Workspace, WorkspaceMember], Depends(get_current_workspace)
-    ],
+    workspace_data: Annotated[WorkspaceContext, Depends(get_current_workspace)],
     db: Annotated[AsyncSession, Depends(get_db)],
 ):
     """Get session messages."""
     service = SessionService(db)
     messages = await service.get_messages(session_id)
-    return {
-        "success": True,
-        "messages": [MessageResponse.model_validate(m) for m in messages],
-    }
+    responses = _MESSAGE_LIST_ADAPTER.validate_python(messages, from_attributes=True)
+    return list_envelope("messages", _MESSAGE_LIST_ADAPTER.dump_json(responses))
 
-@router.post("/{workspace_id}/sessions/{session_id}/messages", response_model=dict)
+@router.post("/{workspace_id}/sessions/{session_id}/messages", response_model=AddMessageResponse)
 async def add_message(
     workspace_id: str,
     session_id: str,
     data: MessageCreate,
-    workspace_data: Annotated[
-        tuple[Workspace, WorkspaceMember], Depends(get_current_workspace)
-    ],
+    workspace_data: Annotated[WorkspaceContext, Depends(get_current_workspace)],
     db: Annotated[AsyncSession, Depends(get_db)],
 ):
     """Add a message to the session."""
     service = SessionService(db)
     session = await service.get_session(session_id)
     message = await service.add_message(session, data.content, "user")
+    # id/created_at defaults are applied client-side at flush; no refresh needed.
     await db.flush()
-    await db.refresh(message)
 
     return {
         "success": True,
         "user_message": MessageResponse.model_validate(message),
     }
 
-@router.get("/{workspace_id}/sessions/{session_id}/operations", response_model=dict)
+@router.get(
+    "/{workspace_id}/sessions/{session_id}/operations",
+    response_model=OperationListResponse,
+    response_class=ORJSONResponse,
+)
 async def get_operations(
     workspace_id: str,
     session_id: str,
-    workspace_data: Annotated[
-        tuple[Workspace, WorkspaceMember], Depends(get_current_workspace)
-    ],
+    workspace_data: Annotated[WorkspaceContext, Depends(get_current_workspace)],
     db: Annotated[AsyncSession, Depends(get_db)],
 ):
     """Get session operations."""
     service = SessionService(db)
-    operations = await service.get_operations(session_id)
-    return {
-        "success": True,
-        "operations": [OperationResponse.model_validate(op) for op in operations],
-    }
+    rows = await service.get_operation_rows(session_id)
+    # Column rows match OperationResponse; orjson serializes them natively
+    return ORJSONResponse({"success": True, "operations": [dict(row) for row in rows]})
 
 @router.post("/{workspace_id}/sessions/{session_id}/undo", response_model=UndoResponse)
 async def undo_operation(
     workspace_id: str,
     session_id: str,
-    workspace_data: Annotated[
-        tuple[Workspace, WorkspaceMember], Depends(get_current_workspace)
-    ],
+    workspace_data: Annotated[WorkspaceContext, Depends(get_current_workspace)],
     current_user: Annotated[User, Depends(get_current_user)],
     db: Annotated[AsyncSession, Depends(get_db)],
 ):
@@ -161,9 +162,7 @@ async def undo_operation(
 async def redo_operation(
     workspace_id: str,
     session_id: str,
-    workspace_data: Annotated[
-        tuple[Workspace, WorkspaceMember], Depends(get_current_workspace)
-    ],
+    workspace_data: Annotated[WorkspaceContext, Depends(get_current_workspace)],
     current_user: Annotated[User, Depends(get_current_user)],
     db: Annotated[AsyncSession, Depends(get_db)],
 ):
@@ -177,9 +176,7 @@ async def commit_session(
     workspace_id: str,
     session_id: str,
     data: CommitRequest,
-    workspace_data: Annotated[
-        tuple[Workspace, WorkspaceMember], Depends(get_current_workspace)
-    ],
+    workspace_data: Annotated[WorkspaceContext, Depends(get_current_workspace)],
     current_user: Annotated[User, Depends(get_current_user)],
     db: Annotated[AsyncSession, Depends(get_db)],
 ):
@@ -193,9 +190,7 @@ async def resolve_conflicts(
     workspace_id: str,
     session_id: str,
     data: ResolveConflictsRequest,
-    workspace_data: Annotated[
-        tuple[Workspace, WorkspaceMember], Depends(get_current_workspace)
-    ],
+    workspace_data: Annotated[WorkspaceContext, Depends(get_current_workspace)],
     current_user: Annotated[User, Depends(get_current_user)],
     db: Annotated[AsyncSession, Depends(get_db)],
 ):
@@ -210,9 +205,7 @@ async def resolve_conflicts(
 async def discard_session(
     workspace_id: str,
     session_id: str,
-    workspace_data: Annotated[
-        tuple[Workspace, WorkspaceMember], Depends(get_current_workspace)
-    ],
+    workspace_data: Annotated[WorkspaceContext, Depends(get_current_workspace)],
     current_user: Annotated[User, Depends(get_current_user)],
     db: Annotated[AsyncSession, Depends(get_db)],
 ):
@@ -10,28 +10,34 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from forecasto.database import get_db
 from forecasto.dependencies import (
+    WorkspaceContext,
     check_area_permission,
     get_current_user,
     get_current_workspace,
 )
 from forecasto.models.user import User
-from forecasto.models.workspace import Workspace, WorkspaceMember
-from forecasto.schemas.record import TransferRequest, TransferResponse
+from forecasto.schemas.record import RecordResponse, TransferRequest, TransferResponse
 from forecasto.services.event_bus import event_bus
 from forecasto.services.record_service import RecordService
 from forecasto.services.transfer_service import TransferService
+from forecasto.utils.responses import ORJSONResponse
 
 router = APIRouter()
 
-@router.post("/{workspace_id}/records/{record_id}/transfer", response_model=TransferResponse)
+WorkspaceDep = Annotated[WorkspaceContext, Depends(get_current_workspace)]
+UserDep = Annotated[User, Depends(get_current_user)]
+
+@router.post(
+    "/{workspace_id}/records/{record_id}/transfer",
+    response_model=TransferResponse,
+    response_class=ORJSONResponse,
+)
 async def transfer_record(
     workspace_id: str,
     record_id: str,
     data: TransferRequest,
-    workspace_data: Annotated[
-        tuple[Workspace, WorkspaceMember], Depends(get_current_workspace)
-    ],
-    current_user: Annotated[User, Depends(get_current_user)],
+    workspace_data: WorkspaceDep,
+    current_user: UserDep,
     db: Annotated[AsyncSession, Depends(get_db)],
 ):
     """Transfer a record to another area."""
@@ -46,25 +52,23 @@ async def transfer_record(
     check_area_permission(member, data.to_area, "write")
 
     transfer_service = TransferService(db)
-    record = await transfer_service.transfer_record(
+    record, from_area = await transfer_service.transfer_record(
         record, data.to_area, current_user, data.note
     )
 
-    from forecasto.schemas.record import RecordResponse
-
     # Use Pydantic auto-mapping
     record_response = RecordResponse.model_validate(record)
 
     await event_bus.publish("records_changed", workspace_id, {"action": "transfer"})
 
-    return TransferResponse(
+    # Built from trusted server data: dump once and skip FastAPI's outbound validation
+    response = TransferResponse(
         record=record_response,
         operation={
             "id": record.id,
             "operation_type": "transfer",
-            "from_area": record.transfer_history[-2]["from_area"]
-            if len(record.transfer_history) > 1
-            else record.transfer_history[-1]["from_area"],
+            "from_area": from_area,
             "to_area": data.to_area,
         },
     )
+    return ORJSONResponse(response.model_dump(mode="json"))
@@ -7,12 +7,12 @@ from typing import Annotated
 
 from fastapi import APIRouter, Depends
 from fastapi.responses import Response
-from sqlalchemy import select
+from sqlalchemy import bindparam, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from forecasto.database import get_db
 from forecasto.dependencies import get_current_user
-from forecasto.exceptions import NotFoundException
+from forecasto.exceptions import NotFoundException, ValidationException
 from forecasto.models.user import User
 from forecasto.schemas.common import SuccessResponse
 from forecasto.schemas.user import (
@@ -25,10 +25,22 @@ from forecasto.schemas.user import (
 )
 from forecasto.services.auth_service import AuthService
 from forecasto.services.user_service import UserService
+from forecasto.utils.responses import ORJSONResponse
+from forecasto.utils.security import verify_password as check_password
 
 router = APIRouter()
 
-@router.post("/register", response_model=UserResponse, status_code=201)
+# Characters users may type as separators in an invite code
+_INVITE_CODE_STRIP = str.maketrans("", "", "- ")
+
+# Built once; reads only the two columns the lookup returns (invite_code is unique/indexed)
+_INVITE_LOOKUP_STMT = select(User.name, User.invite_code).where(
+    User.invite_code == bindparam("code")
+)
+
+@router.post(
+    "/register", response_model=UserResponse, response_class=ORJSONResponse, status_code=201
+)
 async def register(
     data: UserCreate,
     db: Annotated[AsyncSession, Depends(get_db)],
@@ -39,16 +51,18 @@ async def register(
     user = await service.register(
         data.email, data.password, data.name, data.registration_code
     )
-    return UserResponse.model_validate(user)
+    return ORJSONResponse(
+        UserResponse.model_validate(user).model_dump(mode="json"), status_code=201
+    )
 
-@router.get("/me", response_model=UserResponse)
+@router.get("/me", response_model=UserResponse, response_class=ORJSONResponse)
 async def get_current_user_profile(
     current_user: Annotated[User, Depends(get_current_user)],
 ):
     """Get current user profile."""
-    return UserResponse.model_validate(current_user)
+    return ORJSONResponse(UserResponse.model_validate(current_user).model_dump(mode="json"))
 
-@router.patch("/me", response_model=UserResponse)
+@router.patch("/me", response_model=UserResponse, response_class=ORJSONResponse)
 async def update_profile(
     data: UserUpdate,
     current_user: Annotated[User, Depends(get_current_user)],
@@ -57,7 +71,7 @@ async def update_profile(
     """Update current user profile."""
     service = UserService(db)
     user = await service.update_user(current_user, data)
-    return UserResponse.model_validate(user)
+    return ORJSONResponse(UserResponse.model_validate(user).model_dump(mode="json"))
 
 
 @router.post("/me/password", response_model=SuccessResponse)
@@ -79,17 +93,15 @@ async def lookup_user_by_code(
     db: Annotated[AsyncSession, Depends(get_db)],
 ):
     """Lookup user by invite code - returns only name for privacy."""
-    # Normalize code: uppercase, remove dashes and spaces
-    cleaned = invite_code.upper().replace('-', '').replace(' ', '')
+    # Normalize code: drop dashes and spaces in one pass, then uppercase
+    cleaned = invite_code.translate(_INVITE_CODE_STRIP).upper()
     if len(cleaned) != 9:
         raise NotFoundException("Codice non valido")
 
     normalized = f"{cleaned[:3]}-{cleaned[3:6]}-{cleaned[6:9]}"
 
-    result = await db.execute(
-        select(User).where(User.invite_code == normalized)
-    )
-    user = result.scalar_one_or_none()
+    result = await db.execute(_INVITE_LOOKUP_STMT, {"code": normalized})
+    user = result.one_or_none()
 
     if not user:
         raise NotFoundException(f"Nessun utente trovato con codice {normalized}")
@@ -109,8 +121,6 @@ async def verify_password(
     current_user: Annotated[User, Depends(get_current_user)],
 ):
     """Verify the user's current password (used before sensitive operations)."""
-    from forecasto.utils.security import verify_password as check_password
-    from forecasto.exceptions import ValidationException
     if not check_password(data.current_password, current_user.password_hash):
         raise ValidationException("Password non corretta")
     return SuccessResponse(success=True)
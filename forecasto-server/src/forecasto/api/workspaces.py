@@ -6,12 +6,12 @@ from __future__ import annotations
 from typing import Annotated
 
 from fastapi import APIRouter, Depends
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from forecasto.database import get_db
-from forecasto.dependencies import get_current_user, get_current_workspace
+from forecasto.dependencies import WorkspaceContext, get_current_user, get_current_workspace
 from forecasto.models.user import User
-from forecasto.models.workspace import Workspace, WorkspaceMember
 from forecasto.schemas.common import SuccessResponse
 from forecasto.schemas.bank_account import BankAccountResponse
 from forecasto.schemas.workspace import (
@@ -20,17 +20,26 @@ from forecasto.schemas.workspace import (
     MemberResponse,
     MemberUpdate,
     WorkspaceCreate,
+    WorkspaceListResponse,
     WorkspaceResponse,
     WorkspaceUpdate,
     WorkspaceWithRole,
 )
 from forecasto.services.workspace_service import WorkspaceService
+from forecasto.utils.responses import ORJSONResponse, PydanticResponse, list_envelope
 
 router = APIRouter()
 
-@router.get("", response_model=dict)
+WorkspaceDep = Annotated[WorkspaceContext, Depends(get_current_workspace)]
+UserDep = Annotated[User, Depends(get_current_user)]
+
+# List adapters built once at import: one pydantic-core call per list, not per item.
+_MEMBER_LIST_ADAPTER = TypeAdapter(list[MemberResponse])
+_BANK_ACCOUNT_LIST_ADAPTER = TypeAdapter(list[BankAccountResponse])
+
+@router.get("", response_model=WorkspaceListResponse, response_class=PydanticResponse)
 async def list_workspaces(
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: UserDep,
     db: Annotated[AsyncSession, Depends(get_db)],
 ):
     """List workspaces accessible by current user."""
@@ -38,8 +47,9 @@ async def list_workspaces(
     service = WorkspaceService(db)
     results = await service.list_workspaces(current_user)
 
+    # Rows come straight from the database, so skip re-validating every field.
     workspaces = [
-        WorkspaceWithRole(
+        WorkspaceWithRole.model_construct(
             id=ws.id,
             name=ws.name,
             description=ws.description,
@@ -49,7 +59,9 @@ async def list_workspaces(
             area_permissions=member.area_permissions,
             vat_registry_id=ws.vat_registry_id,
             bank_account_id=ws.bank_account_id,
-            bank_accounts=[BankAccountResponse.model_validate(a) for a in ws.bank_accounts],
+            bank_accounts=_BANK_ACCOUNT_LIST_ADAPTER.validate_python(
+                ws.bank_accounts, from_attributes=True
+            ),
             can_import=member.can_import,
             can_import_sdi=member.can_import_sdi,
             can_export=member.can_export,
@@ -63,18 +75,18 @@ async def list_workspaces(
         for ws, member in results
     ]
 
-    return {"success": True, "workspaces": workspaces}
+    return PydanticResponse(WorkspaceListResponse.model_construct(workspaces=workspaces))
 
-@router.post("", response_model=dict, status_code=201)
+@router.post("", response_class=ORJSONResponse, status_code=201)
 async def create_workspace(
     data: WorkspaceCreate,
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: UserDep,
     db: Annotated[AsyncSession, Depends(get_db)],
 ):
     """Create a new workspace."""
     service = WorkspaceService(db)
     workspace = await service.create_workspace(data, current_user)
-    return {"success": True, "workspace": WorkspaceWithRole(
+    response = WorkspaceWithRole(
         id=workspace.id,
         name=workspace.name,
         description=workspace.description,
@@ -91,30 +103,29 @@ async def create_workspace(
         can_create_numerators=True,
         can_write_numerators=True,
         can_read_numerators=True,
-    )}
+    )
+    return ORJSONResponse(
+        {"success": True, "workspace": response.model_dump(mode="json")}, status_code=201
+    )
 
-@router.get("/{workspace_id}", response_model=dict)
+@router.get("/{workspace_id}", response_class=ORJSONResponse)
 async def get_workspace(
-    workspace_data: Annotated[
-        tuple[Workspace, WorkspaceMember], Depends(get_current_workspace)
-    ],
+    workspace_data: WorkspaceDep,
 ):
     """Get workspace details."""
     workspace, member = workspace_data
-    return {
+    return ORJSONResponse({
         "success": True,
-        "workspace": WorkspaceResponse.model_validate(workspace),
+        "workspace": WorkspaceResponse.model_validate(workspace).model_dump(mode="json"),
         "role": member.role,
         "area_permissions": member.area_permissions,
-    }
+    })
 
-@router.patch("/{workspace_id}", response_model=dict)
+@router.patch("/{workspace_id}", response_class=ORJSONResponse)
 async def update_workspace(
     workspace_id: str,
     data: WorkspaceUpdate,
-    workspace_data: Annotated[
-        tuple[Workspace, WorkspaceMember], Depends(get_current_workspace)
-    ],
+    workspace_data: WorkspaceDep,
     db: Annotated[AsyncSession, Depends(get_db)],
 ):
     """Update workspace details."""
@@ -123,19 +134,17 @@ async def update_workspace(
     updated = await service.update_workspace(workspace, data, member)
     await db.commit()
     await db.refresh(updated)
-    return {
+    return ORJSONResponse({
         "success": True,
-        "workspace": WorkspaceResponse.model_validate(updated),
+        "workspace": WorkspaceResponse.model_validate(updated).model_dump(mode="json"),
         "role": member.role,
         "area_permissions": member.area_permissions,
-    }
+    })
 
 @router.delete("/{workspace_id}", response_model=dict)
 async def delete_workspace(
     workspace_id: str,
-    workspace_data: Annotated[
-        tuple[Workspace, WorkspaceMember], Depends(get_current_workspace)
-    ],
+    workspace_data: WorkspaceDep,
     db: Annotated[AsyncSession, Depends(get_db)],
 ):
     """Delete a workspace. Only owners can delete workspaces."""
@@ -146,12 +155,10 @@ async def delete_workspace(
     return {"success": True, "message": "Workspace deleted"}
 
 
-@router.get("/{workspace_id}/members", response_model=dict)
+@router.get("/{workspace_id}/members", response_class=ORJSONResponse)
 async def list_members(
     workspace_id: str,
-    workspace_data: Annotated[
-        tuple[Workspace, WorkspaceMember], Depends(get_current_workspace)
-    ],
+    workspace_data: WorkspaceDep,
     db: Annotated[AsyncSession, Depends(get_db)],
 ):
     """List workspace members."""
@@ -159,18 +166,16 @@ async def list_members(
     members = await service.get_members(workspace_id)
 
     # User relationship is eagerly loaded by service, use Pydantic auto-mapping
-    member_responses = [MemberResponse.model_validate(m) for m in members]
+    member_responses = _MEMBER_LIST_ADAPTER.validate_python(members, from_attributes=True)
 
-    return {"success": True, "members": member_responses}
+    return list_envelope("members", _MEMBER_LIST_ADAPTER.dump_json(member_responses))
 
 @router.post("/{workspace_id}/invitations", response_model=dict, status_code=201)
 async def create_invitation(
     workspace_id: str,
     data: InvitationCreate,
-    workspace_data: Annotated[
-        tuple[Workspace, WorkspaceMember], Depends(get_current_workspace)
-    ],
-    current_user: Annotated[User, Depends(get_current_user)],
+    workspace_data: WorkspaceDep,
+    current_user: UserDep,
     db: Annotated[AsyncSession, Depends(get_db)],
 ):
     """Create an invitation to join workspace."""
@@ -180,38 +185,34 @@ async def create_invitation(
     return {"success": True, "invitation": InvitationResponse.model_validate(invitation)}
 
 
-@router.get("/{workspace_id}/invitations", response_model=dict)
+@router.get("/{workspace_id}/invitations", response_class=ORJSONResponse)
 async def list_workspace_invitations(
     workspace_id: str,
-    workspace_data: Annotated[
-        tuple[Workspace, WorkspaceMember], Depends(get_current_workspace)
-    ],
+    workspace_data: WorkspaceDep,
     db: Annotated[AsyncSession, Depends(get_db)],
 ):
     """List pending invitations for a workspace."""
     workspace, member = workspace_data
     service = WorkspaceService(db)
     invitations = await service.get_workspace_invitations_with_user(workspace_id)
-    return {
+    return ORJSONResponse({
         "success": True,
         "invitations": invitations,
-    }
+    })
 
 
-@router.get("/{workspace_id}/invitable-users", response_model=dict)
+@router.get("/{workspace_id}/invitable-users", response_class=ORJSONResponse)
 async def get_invitable_users(
     workspace_id: str,
-    workspace_data: Annotated[
-        tuple[Workspace, WorkspaceMember], Depends(get_current_workspace)
-    ],
-    current_user: Annotated[User, Depends(get_current_user)],
+    workspace_data: WorkspaceDep,
+    current_user: UserDep,
     db: Annotated[AsyncSession, Depends(get_db)],
 ):
     """Get users from the same billing profile that can be invited."""
     workspace, member = workspace_data
     service = WorkspaceService(db)
     users = await service.get_invitable_users(workspace_id, current_user)
-    return {"success": True, "users": users}
+    return ORJSONResponse({"success": True, "users": users})
 
 
 @router.patch("/{workspace_id}/invitations/{invitation_id}", response_model=dict)
@@ -219,9 +220,7 @@ async def update_invitation(
     workspace_id: str,
     invitation_id: str,
     data: MemberUpdate,
-    workspace_data: Annotated[
-        tuple[Workspace, WorkspaceMember], Depends(get_current_workspace)
-    ],
+    workspace_data: WorkspaceDep,
     db: Annotated[AsyncSession, Depends(get_db)],
 ):
     """Update a pending invitation's role and permissions."""
@@ -235,9 +234,7 @@ async def update_invitation(
 async def cancel_invitation(
     workspace_id: str,
     invitation_id: str,
-    workspace_data: Annotated[
-        tuple[Workspace, WorkspaceMember], Depends(get_current_workspace)
-    ],
+    workspace_data: WorkspaceDep,
     db: Annotated[AsyncSession, Depends(get_db)],
 ):
     """Cancel a pending invitation."""
@@ -247,15 +244,15 @@ async def cancel_invitation(
     return {"success": True, "message": "Invito annullato"}
 
 
-@router.get("/invitations/pending", response_model=dict)
+@router.get("/invitations/pending", response_class=ORJSONResponse)
 async def list_pending_invitations(
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: UserDep,
     db: Annotated[AsyncSession, Depends(get_db)],
 ):
     """List pending invitations for the current user."""
     service = WorkspaceService(db)
     invitations = await service.get_pending_invitations_for_user(current_user)
-    return {
+    return ORJSONResponse({
         "success": True,
         "invitations": [
             {
@@ -270,19 +267,18 @@ async def list_pending_invitations(
             }
             for inv in invitations
         ],
-    }
+    })
 
 
 @router.post("/invitations/{invitation_id}/accept", response_model=dict)
 async def accept_invitation(
     invitation_id: str,
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: UserDep,
     db: Annotated[AsyncSession, Depends(get_db)],
 ):
     """Accept a pending invitation."""
     service = WorkspaceService(db)
     member = await service.accept_invitation(invitation_id, current_user)
-    await db.refresh(member, ["user"])
     return {
         "success": True,
         "message": "Invitation accepted",
@@ -293,10 +289,8 @@ async def accept_invitation(
 async def remove_member(
     workspace_id: str,
     user_id: str,
-    workspace_data: Annotated[
-        tuple[Workspace, WorkspaceMember], Depends(get_current_workspace)
-    ],
-    current_user: Annotated[User, Depends(get_current_user)],
+    workspace_data: WorkspaceDep,
+    current_user: UserDep,
     db: Annotated[AsyncSession, Depends(get_db)],
 ):
     """Remove a member from a workspace."""
@@ -311,16 +305,13 @@ async def update_member(
     workspace_id: str,
     user_id: str,
     data: MemberUpdate,
-    workspace_data: Annotated[
-        tuple[Workspace, WorkspaceMember], Depends(get_current_workspace)
-    ],
+    workspace_data: WorkspaceDep,
     db: Annotated[AsyncSession, Depends(get_db)],
 ):
     """Update member role and permissions."""
     workspace, requesting_member = workspace_data
     service = WorkspaceService(db)
     member = await service.update_member(workspace_id, user_id, data, requesting_member)
-    await db.refresh(member, ["user"])
 
     return {
         "success": True,
@@ -10,6 +10,16 @@ class Settings(BaseSettings):
 
     # Database
     database_url: str = "sqlite+aiosqlite:///./forecasto.db"
+    # Connection pool (ignored for in-memory SQLite, which uses a single connection)
+    db_pool_size: int = 10
+    db_max_overflow: int = 20
+    db_pool_timeout_seconds: int = 30
+    db_pool_recycle_seconds: int = 300
+    # asyncpg only: per-connection prepared-statement cache and query timeout
+    db_statement_cache_size: int = 1024
+    db_command_timeout_seconds: int = 60
+    # SQLAlchemy compiled-statement LRU; ORM flushes add one entry per changed-column set
+    db_query_cache_size: int = 1200
 
     # Auth
     secret_key: str = "change-me-in-production-use-a-secure-random-key"
@@ -56,6 +66,8 @@ class Settings(BaseSettings):
         "env_file": ".env",
         "env_file_encoding": "utf-8",
         "env_ignore_empty": True,
+        # Read once at startup; freezing lets modules bind derived values at import.
+        "frozen": True,
     }
 
 settings = Settings()
@@ -4,15 +4,46 @@ from __future__ import annotations
 
 
 from collections.abc import AsyncGenerator
+from contextlib import AsyncExitStack
+from typing import Any
 
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import ORMExecuteState, Session
 
 from forecasto.config import settings
 
+def _engine_options(database_url: str) -> dict[str, Any]:
+    """Pool sizing and driver tuning for the configured database."""
+    url = make_url(database_url)
+    if url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:"):
+        # In-memory SQLite runs on a single shared connection, not a QueuePool
+        return {}
+
+    options: dict[str, Any] = {
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout_seconds,
+        "pool_recycle": settings.db_pool_recycle_seconds,
+        # Reuse the most recently returned connection so surplus ones go idle and recycle
+        "pool_use_lifo": True,
+    }
+    if url.get_driver_name() == "asyncpg":
+        options["pool_pre_ping"] = True
+        options["connect_args"] = {
+            "statement_cache_size": settings.db_statement_cache_size,
+            "command_timeout": settings.db_command_timeout_seconds,
+            "server_settings": {"jit": "off"},
+        }
+    return options
+
 engine = create_async_engine(
     settings.database_url,
     echo=False,
     future=True,
+    query_cache_size=settings.db_query_cache_size,
+    **_engine_options(settings.database_url),
 )
 
 async_session_maker = async_sessionmaker(
@@ -21,17 +52,49 @@ async_session_maker = async_sessionmaker(
     expire_on_commit=False,
 )
 
+# Sessions record in .info whether the current transaction has written anything, so
+# read-only requests can skip the COMMIT (closing the session rolls back instead).
+_HAS_WRITES = "has_writes"
+
+@event.listens_for(Session, "after_flush")
+def _mark_flush(session: Session, flush_context: Any) -> None:
+    session.info[_HAS_WRITES] = True
+
+@event.listens_for(Session, "do_orm_execute")
+def _mark_statement(orm_execute_state: ORMExecuteState) -> None:
+    # Core update()/delete()/insert() and text() bypass the flush
+    if not orm_execute_state.is_select:
+        orm_execute_state.session.info[_HAS_WRITES] = True
+
+@event.listens_for(Session, "after_commit")
+def _clear_writes(session: Session) -> None:
+    session.info.pop(_HAS_WRITES, None)
+
+def session_has_writes(session: AsyncSession) -> bool:
+    """Whether the session's current transaction has (or is about to have) writes."""
+    return bool(
+        session.info.get(_HAS_WRITES) or session.new or session.dirty or session.deleted
+    )
+
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """Dependency that provides a database session."""
 
     async with async_session_maker() as session:
         try:
             yield session
-            await session.commit()
+            if session_has_writes(session):
+                await session.commit()
         except Exception:
             await session.rollback()
             raise
 
+async def warm_pool() -> None:
+    """Open the pool's base connections at startup so first requests skip the connect."""
+    pool_size = _engine_options(settings.database_url).get("pool_size", 0)
+    async with AsyncExitStack() as stack:
+        for _ in range(pool_size):
+            await stack.enter_async_context(engine.connect())
+
 async def init_db() -> None:
     """Initialize database tables."""
     from forecasto.models.base import Base
@@ -3,10 +3,11 @@
 from __future__ import annotations
 
 
-from typing import Annotated
+import time
+from typing import Annotated, Any, NamedTuple
 
 from fastapi import Depends, Header
-from sqlalchemy import select
+from sqlalchemy import and_, bindparam, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from forecasto.database import get_db
@@ -23,6 +24,51 @@ from forecasto.models.user import User
 from forecasto.models.workspace import Workspace, WorkspaceMember
 from forecasto.utils.security import decode_token
 
+# Verified access-token payloads, keyed by the raw token: (monotonic deadline, payload).
+# Entries live for at most _TOKEN_CACHE_TTL_SECONDS and never past the token's exp.
+_TOKEN_CACHE_TTL_SECONDS = 30
+_TOKEN_CACHE_MAX_ENTRIES = 10_000
+_token_cache: dict[str, tuple[float, dict[str, Any]]] = {}
+
+def _decode_token_cached(token: str) -> dict[str, Any]:
+    """Decode a JWT, reusing the payload of a recent successful verification.
+
+    Failed verifications raise ``ValueError`` from ``decode_token`` and are
+    never cached. The returned payload is shared and must not be mutated.
+    """
+    now = time.monotonic()
+    cached = _token_cache.get(token)
+    if cached is not None and cached[0] > now:
+        return cached[1]
+
+    payload = decode_token(token)
+
+    ttl = float(_TOKEN_CACHE_TTL_SECONDS)
+    exp = payload.get("exp")
+    if exp is not None:
+        ttl = min(ttl, exp - time.time())
+    if ttl > 0:
+        _token_cache.pop(token, None)
+        if len(_token_cache) >= _TOKEN_CACHE_MAX_ENTRIES:
+            # Dicts keep insertion order: drop the oldest entry
+            del _token_cache[next(iter(_token_cache))]
+        _token_cache[token] = (now + ttl, payload)
+    return payload
+
+# Built once at import; requests only bind parameters.
+# The outer join still tells "no workspace" (no row) from "not a member" (NULL member)
+_WORKSPACE_MEMBER_STMT = (
+    select(Workspace, WorkspaceMember)
+    .outerjoin(
+        WorkspaceMember,
+        and_(
+            WorkspaceMember.workspace_id == Workspace.id,
+            WorkspaceMember.user_id == bindparam("user_id"),
+        ),
+    )
+    .where(Workspace.id == bindparam("workspace_id"))
+)
+
 async def get_current_user(
     db: Annotated[AsyncSession, Depends(get_db)],
     authorization: Annotated[str | None, Header()] = None,
@@ -32,13 +78,12 @@ async def get_current_user(
     if not authorization:
         raise UnauthorizedException("Authorization header required")
 
-    if not authorization.startswith("Bearer "):
+    token = authorization.removeprefix("Bearer ")
+    if len(token) == len(authorization):
         raise UnauthorizedException("Invalid authorization header format")
 
-    token = authorization[7:]
-
     try:
-        payload = decode_token(token)
+        payload = _decode_token_cached(token)
     except ValueError as e:
         raise UnauthorizedException(str(e))
 
@@ -49,8 +94,7 @@ async def get_current_user(
     if not user_id:
         raise UnauthorizedException("Invalid token payload")
 
-    result = await db.execute(select(User).where(User.id == user_id))
-    user = result.scalar_one_or_none()
+    user = await db.get(User, user_id)
 
     if not user:
         raise UnauthorizedException("User not found")
@@ -63,30 +107,35 @@ async def get_current_user(
 
     return user
 
+class WorkspaceContext(NamedTuple):
+    """Workspace and the caller's membership, as resolved by get_current_workspace."""
+
+    workspace: Workspace
+    member: WorkspaceMember
+
 async def get_current_workspace(
     workspace_id: str,
     db: Annotated[AsyncSession, Depends(get_db)],
     current_user: Annotated[User, Depends(get_current_user)],
-) -> tuple[Workspace, WorkspaceMember]:
+) -> WorkspaceContext:
     """Get workspace and verify user has access."""
-    result = await db.execute(select(Workspace).where(Workspace.id == workspace_id))
-    workspace = result.scalar_one_or_none()
-
-    if not workspace:
-        raise NotFoundException(f"Workspace {workspace_id} not found")
-
+    # One round-trip for both the workspace and the caller's membership
     result = await db.execute(
-        select(WorkspaceMember).where(
-            WorkspaceMember.workspace_id == workspace_id,
-            WorkspaceMember.user_id == current_user.id,
-        )
+        _WORKSPACE_MEMBER_STMT, {"workspace_id": workspace_id, "user_id": current_user.id}
     )
-    member = result.scalar_one_or_none()
+    row = result.one_or_none()
+
+    if row is None:
+        raise NotFoundException(f"Workspace {workspace_id} not found")
 
+    workspace, member = row
     if not member:
         raise ForbiddenException("You are not a member of this workspace")
 
-    return workspace, member
+    # Prime the readable-area set once; endpoints and permission checks reuse it.
+    get_readable_areas(member)
+
+    return WorkspaceContext(workspace, member)
 
 async def get_active_session(
     workspace_id: str,
@@ -98,15 +147,10 @@ async def get_active_session(
     if not x_session_id:
         return None
 
-    result = await db.execute(
-        select(Session).where(
-            Session.id == x_session_id,
-            Session.workspace_id == workspace_id,
-        )
-    )
-    session = result.scalar_one_or_none()
+    # Primary-key lookup through the identity map; the workspace is checked on the row
+    session = await db.get(Session, x_session_id)
 
-    if not session:
+    if not session or session.workspace_id != workspace_id:
         raise NotFoundException(f"Session {x_session_id} not found")
 
     if session.status != "active":
@@ -133,16 +177,44 @@ async def require_active_session(
 
     return session
 
+def _area_access(member: WorkspaceMember) -> tuple[frozenset[str], frozenset[str]]:
+    """Return (readable, writable) area sets, cached on the member instance.
+
+    The cache is tied to the current ``area_permissions`` dict, so reassigning
+    the permissions (the only way JSON columns get updated) invalidates it.
+    """
+    permissions = member.area_permissions
+    cached = member.__dict__.get("_area_access")
+    if cached is not None and cached[0] is permissions:
+        return cached[1]
+
+    items = (permissions or {}).items()
+    access = (
+        frozenset(a for a, perm in items if perm != "none"),
+        frozenset(a for a, perm in items if perm == "write"),
+    )
+    member.__dict__["_area_access"] = (permissions, access)
+    return access
+
+
+def get_readable_areas(member: WorkspaceMember) -> frozenset[str]:
+    """Return the areas the member can read (cached for the member's lifetime)."""
+    return _area_access(member)[0]
+
+
+def get_writable_areas(member: WorkspaceMember) -> frozenset[str]:
+    """Return the areas the member can write (cached for the member's lifetime)."""
+    return _area_access(member)[1]
+
+
 def check_area_permission(member: WorkspaceMember, area: str, required: str = "read") -> None:
     """Check if member has required permission for area."""
-    permission = member.area_permissions.get(area, "none")
+    if required == "read" and area not in get_readable_areas(member):
+        raise AreaPermissionDeniedException(area, "read")
 
-    if required == "write" and permission != "write":
+    if required == "write" and area not in get_writable_areas(member):
         raise AreaPermissionDeniedException(area, "write")
 
-    if required == "read" and permission == "none":
-        raise AreaPermissionDeniedException(area, "read")
-
 
 def check_import_permission(member: WorkspaceMember) -> None:
     """Check if member has import permission."""
@@ -5,11 +5,13 @@ from __future__ import annotations
 
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, Request
+import orjson
+from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
 
 from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
 
 from forecasto.api import (
     admin,
@@ -38,21 +40,22 @@ from forecasto.api import (
     workspaces,
 )
 from forecasto.config import settings
-from forecasto.database import async_session_maker, init_db
+from forecasto.database import async_session_maker, init_db, warm_pool
 from forecasto.exceptions import ForecastoException
 from forecasto.models.user import User
+from forecasto.utils.responses import ORJSONResponse
 from forecasto.utils.security import hash_password
 
 async def seed_default_admin():
     """Seed a default admin user if no admin exists."""
     async with async_session_maker() as db:
-        # Check if any admin exists
+        # Check if any admin exists (an id probe, no ORM instance needed)
         result = await db.execute(
-            select(User).where(User.is_admin == True)  # noqa: E712
+            select(User.id).where(User.is_admin.is_(True)).limit(1)
         )
-        existing_admin = result.scalars().first()
+        existing_admin_id = result.scalar()
 
-        if not existing_admin:
+        if existing_admin_id is None:
             # Create default admin
             admin_user = User(
                 email="admin@forecasto.app",
@@ -62,7 +65,12 @@ async def seed_default_admin():
                 must_change_password=True,
             )
             db.add(admin_user)
-            await db.commit()
+            try:
+                await db.commit()
+            except IntegrityError:
+                # Another process inserted it between our check and commit (unique email)
+                await db.rollback()
+                return
             print("Default admin user created: admin@forecasto.app / changeme123")
 
 
@@ -72,6 +80,7 @@ async def lifespan(app: FastAPI):
 
     await init_db()
     await seed_default_admin()
+    await warm_pool()
 
     # Start processing queue
     from forecasto.services.processing_queue import processing_queue
@@ -116,11 +125,15 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress large JSON payloads (record lists, exports, histories). Starlette
+# leaves text/event-stream uncompressed, so SSE delivery is not buffered.
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 # Exception handlers
 @app.exception_handler(ForecastoException)
 async def forecasto_exception_handler(request: Request, exc: ForecastoException):
     """Handle custom Forecasto exceptions."""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={
             "success": False,
@@ -161,16 +174,16 @@ app.include_router(usage.router, prefix="/api/v1/workspaces", tags=["Usage"])
 app.include_router(agent_zero.router, prefix="/api/v1/workspaces", tags=["Agente-zero"])
 app.include_router(prompt_builder.router, prefix="/api/v1", tags=["Prompt Builder"])
 
-@app.get("/health")
+# Probe endpoints return constant bodies, serialized once at import
+_HEALTH_BODY = orjson.dumps({"status": "healthy"})
+_ROOT_BODY = orjson.dumps({"name": "Forecasto API", "version": "1.0.0", "docs": "/docs"})
+
+@app.get("/health", include_in_schema=False)
 async def health_check():
     """Health check endpoint."""
-    return {"status": "healthy"}
+    return Response(_HEALTH_BODY, media_type="application/json")
 
-@app.get("/")
+@app.get("/", include_in_schema=False)
 async def root():
     """Root endpoint."""
-    return {
-        "name": "Forecasto API",
-        "version": "1.0.0",
-        "docs": "/docs",
-    }
+    return Response(_ROOT_BODY, media_type="application/json")
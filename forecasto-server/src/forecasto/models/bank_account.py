@@ -7,7 +7,18 @@ from datetime import date, datetime
 from decimal import Decimal
 from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import Boolean, Date, DateTime, ForeignKey, Numeric, String, Text, UniqueConstraint
+from sqlalchemy import (
+    Boolean,
+    Date,
+    DateTime,
+    ForeignKey,
+    Index,
+    Numeric,
+    String,
+    Text,
+    UniqueConstraint,
+    text,
+)
 from sqlalchemy.dialects.sqlite import JSON
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -21,6 +32,17 @@ class BankAccount(Base, UUIDMixin, TimestampMixin):
     """Bank account owned by a user, associable to multiple workspaces."""
 
     __tablename__ = "bank_accounts"
+    # Partial index for list_user_accounts (owner_id = ? AND is_active = 1 ORDER BY name):
+    # covers only active rows and returns them already sorted.
+    __table_args__ = (
+        Index(
+            "ix_bank_accounts_owner_active",
+            "owner_id",
+            "name",
+            sqlite_where=text("is_active = 1"),
+            postgresql_where=text("is_active"),
+        ),
+    )
 
     owner_id: Mapped[Optional[str]] = mapped_column(
         String(36), ForeignKey("users.id"), nullable=True, index=True
@@ -30,7 +52,7 @@ class BankAccount(Base, UUIDMixin, TimestampMixin):
     description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     currency: Mapped[str] = mapped_column(String(3), default="EUR")
     credit_limit: Mapped[Decimal] = mapped_column(Numeric(15, 2), default=Decimal("0"))
-    is_active: Mapped[bool] = mapped_column(Boolean, default=True, index=True)
+    is_active: Mapped[bool] = mapped_column(Boolean, default=True)
     exclude_from_cashflow: Mapped[bool] = mapped_column(Boolean, default=False)
     settings: Mapped[dict] = mapped_column(
         JSON,
@@ -3,16 +3,39 @@
 from __future__ import annotations
 
 
-import uuid
+import os
+from collections import deque
 from datetime import datetime
 
 from sqlalchemy import DateTime, String
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
+# Pre-formatted UUID4 strings, refilled 1024 at a time from a single os.urandom call.
+# deque.popleft is atomic, so concurrent callers never receive the same value.
+_UUID_BATCH = 1024
+_uuid_pool: deque[str] = deque()
+
+def _refill_uuid_pool() -> None:
+    """Format a batch of random version-4 UUIDs into the pool."""
+    h = os.urandom(16 * _UUID_BATCH).hex()
+    _uuid_pool.extend(
+        # Version nibble is 4; the variant's top two bits are 10 (8, 9, a or b)
+        f"{h[i:i + 8]}-{h[i + 8:i + 12]}-4{h[i + 13:i + 16]}-"
+        f"{'89ab'[int(h[i + 16], 16) & 3]}{h[i + 17:i + 20]}-{h[i + 20:i + 32]}"
+        for i in range(0, len(h), 32)
+    )
+
+# A forked child must not hand out the parent's pending values
+os.register_at_fork(after_in_child=_uuid_pool.clear)
+
 def generate_uuid() -> str:
     """Generate a UUID string."""
 
-    return str(uuid.uuid4())
+    try:
+        return _uuid_pool.popleft()
+    except IndexError:
+        _refill_uuid_pool()
+        return _uuid_pool.popleft()
 
 class Base(DeclarativeBase):
     """Base class for all SQLAlchemy models."""
@@ -7,7 +7,7 @@ from datetime import date, datetime
 from decimal import Decimal
 from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import Date, DateTime, ForeignKey, Integer, Numeric, String, Text
+from sqlalchemy import Date, DateTime, ForeignKey, Index, Integer, Numeric, String, Text, text
 from sqlalchemy.dialects.sqlite import JSON
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -22,12 +22,24 @@ class Record(Base, UUIDMixin, TimestampMixin):
     """Financial record (budget, prospect, orders, actual)."""
 
     __tablename__ = "records"
+    __table_args__ = (
+        # Area-scoped listings filter on workspace + area and range/order on date_cashflow
+        Index("ix_records_ws_area_date", "workspace_id", "area", "date_cashflow"),
+        # Cashflow date-range scans only ever read live rows; tombstones stay out of this index
+        Index(
+            "ix_records_live_ws_date",
+            "workspace_id",
+            "date_cashflow",
+            sqlite_where=text("deleted_at IS NULL"),
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+    )
 
     workspace_id: Mapped[str] = mapped_column(
         String(36), ForeignKey("workspaces.id", ondelete="CASCADE"), nullable=False, index=True
     )
     area: Mapped[str] = mapped_column(
-        String(50), nullable=False, index=True
+        String(50), nullable=False
     )  # budget, prospect, orders, actual
 
     # Main record fields
@@ -102,7 +114,17 @@ class Record(Base, UUIDMixin, TimestampMixin):
 
     # Relationships
     workspace: Mapped["Workspace"] = relationship("Workspace", back_populates="records")
-    bank_account: Mapped[Optional["BankAccount"]] = relationship("BankAccount")
-    creator: Mapped[Optional["User"]] = relationship("User", foreign_keys=[created_by], lazy="select")
-    updater: Mapped[Optional["User"]] = relationship("User", foreign_keys=[updated_by], lazy="select")
-    deleter: Mapped[Optional["User"]] = relationship("User", foreign_keys=[deleted_by], lazy="select")
+    # Audit/bank relations are loaded with RecordService._audit_options; a forgotten
+    # loader fails loudly instead of issuing one query per record.
+    bank_account: Mapped[Optional["BankAccount"]] = relationship(
+        "BankAccount", lazy="raise_on_sql"
+    )
+    creator: Mapped[Optional["User"]] = relationship(
+        "User", foreign_keys=[created_by], lazy="raise_on_sql"
+    )
+    updater: Mapped[Optional["User"]] = relationship(
+        "User", foreign_keys=[updated_by], lazy="raise_on_sql"
+    )
+    deleter: Mapped[Optional["User"]] = relationship(
+        "User", foreign_keys=[deleted_by], lazy="raise_on_sql"
+    )
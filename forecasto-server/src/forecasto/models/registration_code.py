@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import secrets
 from datetime import datetime
 from typing import TYPE_CHECKING, Optional
 
@@ -10,6 +9,7 @@ from sqlalchemy import Boolean, DateTime, ForeignKey, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from forecasto.models.base import Base, TimestampMixin, UUIDMixin
+from forecasto.utils.security import generate_code
 
 if TYPE_CHECKING:
     from forecasto.models.user import User
@@ -21,8 +21,7 @@ def generate_registration_code() -> str:
     Uses alphabet without ambiguous characters: A-Z excluding O, I, L and 2-9 excluding 0, 1.
     This generates 12 characters to distinguish from workspace invite codes (9 chars).
     """
-    alphabet = "ABCDEFGHJKMNPQRSTUVWXYZ23456789"
-    code = "".join(secrets.choice(alphabet) for _ in range(12))
+    code = generate_code(12)
     return f"{code[:4]}-{code[4:8]}-{code[8:12]}"
 
 
@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 
-import secrets
 from datetime import datetime
 from typing import TYPE_CHECKING, Optional
 
@@ -12,6 +11,7 @@ from sqlalchemy.dialects.sqlite import JSON
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from forecasto.models.base import Base, TimestampMixin, UUIDMixin, generate_uuid
+from forecasto.utils.security import generate_code
 
 if TYPE_CHECKING:
     from forecasto.models.agent_token import AgentToken
@@ -25,8 +25,7 @@ def generate_invite_code() -> str:
 
     Uses alphabet without ambiguous characters: A-Z excluding O, I, L and 2-9 excluding 0, 1.
     """
-    alphabet = "ABCDEFGHJKMNPQRSTUVWXYZ23456789"
-    code = "".join(secrets.choice(alphabet) for _ in range(9))
+    code = generate_code(9)
     return f"{code[:3]}-{code[3:6]}-{code[6:9]}"
 
 
@@ -63,11 +63,12 @@ class Workspace(Base, UUIDMixin, TimestampMixin):
     # Relationships
     owner: Mapped["User"] = relationship("User")
     bank_account: Mapped[Optional["BankAccount"]] = relationship("BankAccount", back_populates="workspaces", foreign_keys=[bank_account_id])
+    # Not eager by default: every workspace-scoped request loads its Workspace, but
+    # only the list endpoint and document processing read bank_accounts (both selectinload it)
     bank_accounts: Mapped[list["BankAccount"]] = relationship(
         "BankAccount",
         secondary="workspace_bank_accounts",
         back_populates="linked_workspaces",
-        lazy="selectin",
     )
     vat_registry: Mapped[Optional["VatRegistry"]] = relationship("VatRegistry", back_populates="workspaces")
     members: Mapped[list["WorkspaceMember"]] = relationship(
@@ -98,6 +99,10 @@ class Workspace(Base, UUIDMixin, TimestampMixin):
         "Numerator", back_populates="workspace", cascade="all, delete-orphan"
     )
 
+def _default_area_permissions() -> dict:
+    """Default area permissions - write access to every area."""
+    return {"actual": "write", "orders": "write", "prospect": "write", "budget": "write"}
+
 def _default_granular_permissions() -> dict:
     """Default granular permissions - all permissions enabled."""
     return {
@@ -134,15 +139,7 @@ class WorkspaceMember(Base, UUIDMixin):
     )
     role: Mapped[str] = mapped_column(String(50), nullable=False)  # owner, admin, member, viewer
     joined_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
-    area_permissions: Mapped[dict] = mapped_column(
-        JSON,
-        default=lambda: {
-            "actual": "write",
-            "orders": "write",
-            "prospect": "write",
-            "budget": "write",
-        },
-    )
+    area_permissions: Mapped[dict] = mapped_column(JSON, default=_default_area_permissions)
     granular_permissions: Mapped[dict] = mapped_column(
         JSON,
         default=_default_granular_permissions,
@@ -176,15 +173,7 @@ class Invitation(Base, UUIDMixin):
     invited_by: Mapped[str] = mapped_column(String(36), ForeignKey("users.id"), nullable=False)
     invite_code: Mapped[str] = mapped_column(String(11), nullable=False, index=True)
     role: Mapped[str] = mapped_column(String(50), default="member")
-    area_permissions: Mapped[dict] = mapped_column(
-        JSON,
-        default=lambda: {
-            "actual": "write",
-            "orders": "write",
-            "prospect": "write",
-            "budget": "write",
-        },
-    )
+    area_permissions: Mapped[dict] = mapped_column(JSON, default=_default_area_permissions)
     granular_permissions: Mapped[dict] = mapped_column(
         JSON,
         default=_default_granular_permissions,
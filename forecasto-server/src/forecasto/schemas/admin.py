@@ -265,6 +265,10 @@ class CodeFilter(BaseModel):
     page_size: int = Field(default=50, ge=1, le=100)
 
 
+# Characters users may type as separators in a registration code
+_CODE_STRIP = str.maketrans("", "", "- ")
+
+
 class ValidateCodeRequest(BaseModel):
     """Request to validate a registration code."""
 
@@ -274,7 +278,7 @@ class ValidateCodeRequest(BaseModel):
     @classmethod
     def normalize_code(cls, v: str) -> str:
         """Normalize code format: uppercase, add dashes if missing."""
-        cleaned = v.upper().replace("-", "").replace(" ", "")
+        cleaned = v.translate(_CODE_STRIP).upper()
         if len(cleaned) != 12:
             raise ValueError("Il codice deve essere di 12 caratteri")
         if not cleaned.isalnum():
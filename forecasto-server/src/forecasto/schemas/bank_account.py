@@ -69,3 +69,9 @@ class BalanceResponse(BaseModel):
     note: str | None = None
 
     model_config = {"from_attributes": True}
+
+class BalanceListResponse(BaseModel):
+    """Balance history response."""
+
+    success: bool = True
+    balances: list[BalanceResponse]
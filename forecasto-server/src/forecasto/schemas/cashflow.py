@@ -14,7 +14,7 @@ from pydantic import BaseModel, PlainSerializer
 # The old DecimalAsFloat model_serializer approach was broken because
 # Pydantic v2's default JSON handler converts Decimal → str before the
 # custom serializer runs, so isinstance(obj, Decimal) never matched.
-DecimalFloat = Annotated[Decimal, PlainSerializer(lambda v: float(v), return_type=float)]
+DecimalFloat = Annotated[Decimal, PlainSerializer(float, return_type=float)]
 
 
 class CashflowRequest(BaseModel):
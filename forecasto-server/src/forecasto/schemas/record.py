@@ -174,6 +174,25 @@ class TransferRequest(BaseModel):
             raise ValueError(f"Area must be one of: {valid_areas}")
         return v
 
+class RecordDetailResponse(BaseModel):
+    """Single record response."""
+
+    success: bool = True
+    record: RecordResponse
+
+
+class RecordListResponse(BaseModel):
+    """Record list response (pagination fields are set only when ``limit`` is)."""
+
+    success: bool = True
+    records: list[RecordResponse]
+    total_records: int | None = None
+    limit: int | None = None
+    offset: int | None = None
+    has_more: bool | None = None
+    next_cursor: str | None = None
+
+
 class TransferResponse(BaseModel):
     """Record transfer response."""
 
@@ -142,3 +142,33 @@ class RedoResponse(BaseModel):
     success: bool = True
     redone_operation: OperationResponse
     message: MessageResponse
+
+class SessionDetailResponse(BaseModel):
+    """Single session response."""
+
+    success: bool = True
+    session: SessionResponse
+
+class SessionListResponse(BaseModel):
+    """Session list response."""
+
+    success: bool = True
+    sessions: list[SessionResponse]
+
+class AddMessageResponse(BaseModel):
+    """Add message response."""
+
+    success: bool = True
+    user_message: MessageResponse
+
+class MessageListResponse(BaseModel):
+    """Session message list response."""
+
+    success: bool = True
+    messages: list[MessageResponse]
+
+class OperationListResponse(BaseModel):
+    """Session operation list response."""
+
+    success: bool = True
+    operations: list[OperationResponse]
@@ -8,7 +8,7 @@ from typing import Annotated
 
 from pydantic import BaseModel, PlainSerializer
 
-DecimalFloat = Annotated[Decimal, PlainSerializer(lambda v: float(v), return_type=float)]
+DecimalFloat = Annotated[Decimal, PlainSerializer(float, return_type=float)]
 
 
 class VatCalculationRequest(BaseModel):
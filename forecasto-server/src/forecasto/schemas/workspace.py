@@ -101,6 +101,12 @@ class WorkspaceWithRole(BaseModel):
 
     model_config = {"from_attributes": True}
 
+class WorkspaceListResponse(BaseModel):
+    """Workspace list response."""
+
+    success: bool = True
+    workspaces: list[WorkspaceWithRole]
+
 class MemberUser(BaseModel):
     """Member user info."""
 
@@ -461,20 +461,51 @@ class AdminService:
         count_result = await self.db.execute(count_query)
         total = count_result.scalar() or 0
 
-        # Apply pagination
+        # Apply pagination; code and company come from the same query, not two per user
         offset = (filters.page - 1) * filters.page_size
-        query = query.order_by(User.created_at.desc())
-        query = query.offset(offset).limit(filters.page_size)
+        query = (
+            query.add_columns(RegistrationCode.code, BillingProfile.company_name)
+            .outerjoin(RegistrationCode, RegistrationCode.id == User.registration_code_id)
+            .outerjoin(BillingProfile, BillingProfile.id == User.billing_profile_id)
+            .order_by(User.created_at.desc())
+            .offset(offset)
+            .limit(filters.page_size)
+        )
 
         result = await self.db.execute(query)
-        users = result.scalars().all()
-
-        response = []
-        for user in users:
-            response.append(await self._build_admin_user_response(user))
+        response = [
+            self._admin_user_response(user, registration_code, billing_profile_company)
+            for user, registration_code, billing_profile_company in result.all()
+        ]
 
         return response, total
 
+    @staticmethod
+    def _admin_user_response(
+        user: User, registration_code: str | None, billing_profile_company: str | None
+    ) -> AdminUserResponse:
+        """Build AdminUserResponse from trusted database values, skipping validation."""
+        return AdminUserResponse.model_construct(
+            id=user.id,
+            email=user.email,
+            name=user.name,
+            is_admin=user.is_admin,
+            is_partner=user.is_partner,
+            partner_type=user.partner_type,
+            is_blocked=user.is_blocked,
+            blocked_at=user.blocked_at,
+            blocked_reason=user.blocked_reason,
+            registration_code_id=user.registration_code_id,
+            registration_code=registration_code,
+            billing_profile_id=user.billing_profile_id,
+            billing_profile_company=billing_profile_company,
+            is_billing_master=user.is_billing_master,
+            max_records_free=user.max_records_free,
+            monthly_page_quota=user.monthly_page_quota,
+            created_at=user.created_at,
+            last_login_at=user.last_login_at,
+        )
+
     async def _build_admin_user_response(self, user: User) -> AdminUserResponse:
         """Build AdminUserResponse from a User model instance."""
         registration_code = None
@@ -497,26 +528,7 @@ class AdminService:
             )
             billing_profile_company = bp_result.scalar_one_or_none()
 
-        return AdminUserResponse(
-            id=user.id,
-            email=user.email,
-            name=user.name,
-            is_admin=user.is_admin,
-            is_partner=user.is_partner,
-            partner_type=user.partner_type,
-            is_blocked=user.is_blocked,
-            blocked_at=user.blocked_at,
-            blocked_reason=user.blocked_reason,
-            registration_code_id=user.registration_code_id,
-            registration_code=registration_code,
-            billing_profile_id=user.billing_profile_id,
-            billing_profile_company=billing_profile_company,
-            is_billing_master=user.is_billing_master,
-            max_records_free=user.max_records_free,
-            monthly_page_quota=user.monthly_page_quota,
-            created_at=user.created_at,
-            last_login_at=user.last_login_at,
-        )
+        return self._admin_user_response(user, registration_code, billing_profile_company)
 
     async def get_user(self, user_id: str) -> AdminUserResponse:
         """Get a single user."""
@@ -5,7 +5,7 @@ from __future__ import annotations
 
 from datetime import datetime
 
-from sqlalchemy import select
+from sqlalchemy import RowMapping, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from forecasto.exceptions import ForbiddenException, NotFoundException, ValidationException
@@ -15,6 +15,17 @@ from forecasto.models.user import User
 from forecasto.models.workspace import Workspace, workspace_bank_accounts
 from forecasto.schemas.bank_account import BalanceCreate, BankAccountCreate, BankAccountUpdate
 
+# Columns exposed by BalanceResponse; the balance history reads nothing else.
+_BALANCE_HISTORY_COLUMNS = (
+    BankAccountBalance.id,
+    BankAccountBalance.bank_account_id,
+    BankAccountBalance.balance_date,
+    BankAccountBalance.balance,
+    BankAccountBalance.source,
+    BankAccountBalance.recorded_at,
+    BankAccountBalance.note,
+)
+
 class BankAccountService:
     """Service for bank account operations."""
 
@@ -252,9 +263,13 @@ class BankAccountService:
         account_id: str,
         from_date=None,
         to_date=None,
-    ) -> list[BankAccountBalance]:
-        """Get balance history for an account."""
-        query = select(BankAccountBalance).where(
+    ) -> list[RowMapping]:
+        """Get balance history for an account.
+
+        Read-only path: selects just the columns the response exposes and
+        returns plain row mappings, skipping ORM hydration.
+        """
+        query = select(*_BALANCE_HISTORY_COLUMNS).where(
             BankAccountBalance.bank_account_id == account_id
         )
 
@@ -265,7 +280,7 @@ class BankAccountService:
 
         query = query.order_by(BankAccountBalance.balance_date.desc())
         result = await self.db.execute(query)
-        return list(result.scalars().all())
+        return list(result.mappings().all())
 
     async def delete_balance(self, balance_id: str, account_id: str) -> None:
         """Delete a balance record by ID, ensuring it belongs to the given account."""
@@ -3,15 +3,18 @@
 from __future__ import annotations
 
 
+import base64
 import logging
 import re
+from collections.abc import AsyncIterator, Collection
 from datetime import date, datetime, timedelta
 from decimal import Decimal
-from sqlalchemy import and_, case, func, or_, select, text
+import orjson
+from sqlalchemy import and_, case, func, or_, select, text, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from forecasto.exceptions import ForbiddenException, NotFoundException
+from forecasto.exceptions import ForbiddenException, NotFoundException, ValidationException
 from forecasto.models.record import Record
 from forecasto.models.user import User
 from forecasto.models.workspace import Workspace, WorkspaceMember
@@ -76,6 +79,22 @@ async def _fts_search_ids(
         return None
 
 
+def encode_record_cursor(record: Record) -> str:
+    """Encode a record's position in the list ordering as an opaque cursor."""
+    key = [record.date_cashflow.isoformat(), record.created_at.isoformat(), record.id]
+    return base64.urlsafe_b64encode(orjson.dumps(key)).rstrip(b"=").decode()
+
+
+def decode_record_cursor(cursor: str) -> tuple[date, datetime, str]:
+    """Decode a cursor produced by encode_record_cursor."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        day, created_at, record_id = orjson.loads(base64.urlsafe_b64decode(padded))
+        return date.fromisoformat(day), datetime.fromisoformat(created_at), str(record_id)
+    except (ValueError, TypeError) as exc:
+        raise ValidationException("Invalid pagination cursor") from exc
+
+
 def get_sign_from_amount(amount: Decimal | str | float) -> str:
     """Get sign (in/out) from amount value."""
     if isinstance(amount, str):
@@ -194,9 +213,9 @@ class RecordService:
     DEMO_WORKSPACE_RECORD_LIMIT = 100
 
     async def _check_free_user_record_limit(
-        self, user: User, workspace_id: str
+        self, user: User, workspace_id: str, adding: int = 1
     ) -> dict | None:
-        """Check if creating a record exceeds the applicable limit.
+        """Check if creating ``adding`` records exceeds the applicable limit.
 
         Users with a billing profile have no record limit. Free-tier users in
         demo workspaces (settings.is_demo) hit a hard 100-record cap that
@@ -223,7 +242,7 @@ class RecordService:
                 )
             )
             current_count = count_result.scalar() or 0
-            if current_count >= self.DEMO_WORKSPACE_RECORD_LIMIT:
+            if current_count + adding > self.DEMO_WORKSPACE_RECORD_LIMIT:
                 raise ForbiddenException(
                     f"Hai raggiunto il limite di {self.DEMO_WORKSPACE_RECORD_LIMIT} "
                     "record per il workspace demo. Crea un nuovo workspace per "
@@ -258,7 +277,7 @@ class RecordService:
         )
         current_count = count_result.scalar() or 0
 
-        if current_count >= max_records:
+        if current_count + adding > max_records:
             raise ForbiddenException(
                 f"Hai raggiunto il limite di {max_records} record. "
                 f"Per continuare, contatta l'amministratore per un piano a pagamento."
@@ -285,20 +304,40 @@ class RecordService:
         skip_limit_check: bool = False,
     ) -> Record:
         """Create a new record."""
+        records = await self.create_records_bulk(
+            workspace_id, [data], user, member=member, skip_limit_check=skip_limit_check
+        )
+        return records[0]
+
+    async def create_records_bulk(
+        self,
+        workspace_id: str,
+        datas: list[RecordCreate],
+        user: User,
+        member: WorkspaceMember | None = None,
+        skip_limit_check: bool = False,
+    ) -> list[Record]:
+        """Create many records with one limit check, one seq_num lock and one flush.
+
+        All rows are added before a single flush, so SQLAlchemy emits them as a
+        batched multi-row INSERT instead of one round-trip per record.
+        """
+        if not datas:
+            return []
+
         if not skip_limit_check:
-            await self._check_free_user_record_limit(user, workspace_id)
+            await self._check_free_user_record_limit(user, workspace_id, adding=len(datas))
 
         # Check granular permission if member provided
         if member:
-            sign = get_sign_from_amount(data.amount)
-            if not check_granular_permission(member, data.area, sign, "can_create"):
-                raise ForbiddenException(
-                    f"You don't have permission to create {sign} records in {data.area}"
-                )
-
-        review_date = data.review_date or (data.date_offer + timedelta(days=7))
-
-        # Get workspace owner and assign sequential number
+            for data in datas:
+                sign = get_sign_from_amount(data.amount)
+                if not check_granular_permission(member, data.area, sign, "can_create"):
+                    raise ForbiddenException(
+                        f"You don't have permission to create {sign} records in {data.area}"
+                    )
+
+        # Get workspace owner and lock its sequential-number counter once
         ws_result = await self.db.execute(
             select(Workspace.owner_id).where(Workspace.id == workspace_id)
         )
@@ -307,16 +346,31 @@ class RecordService:
             select(User).where(User.id == owner_id).with_for_update()
         )
         owner_user = owner_result.scalar_one()
-        if data.seq_num is not None:
-            # Use provided seq_num (e.g. legacy import) and advance counter if needed
-            seq_num = data.seq_num
-            if seq_num >= owner_user.next_seq_num:
+
+        records = []
+        for data in datas:
+            if data.seq_num is not None:
+                # Use provided seq_num (e.g. legacy import) and advance counter if needed
+                seq_num = data.seq_num
+                if seq_num >= owner_user.next_seq_num:
+                    owner_user.next_seq_num = seq_num + 1
+            else:
+                seq_num = owner_user.next_seq_num
                 owner_user.next_seq_num = seq_num + 1
-        else:
-            seq_num = owner_user.next_seq_num
-            owner_user.next_seq_num = seq_num + 1
+            records.append(self._build_record(workspace_id, data, user, seq_num))
 
-        record = Record(
+        self.db.add_all(records)
+        await self.db.flush()
+
+        return records
+
+    @staticmethod
+    def _build_record(
+        workspace_id: str, data: RecordCreate, user: User, seq_num: int
+    ) -> Record:
+        """Build a Record ORM object from a creation request."""
+        review_date = data.review_date or (data.date_offer + timedelta(days=7))
+        return Record(
             workspace_id=workspace_id,
             area=data.area,
             type=data.type,
@@ -344,10 +398,6 @@ class RecordService:
             created_by=user.id,
             updated_by=user.id,
         )
-        self.db.add(record)
-        await self.db.flush()
-
-        return record
 
     _audit_options = [
         selectinload(Record.creator),
@@ -356,36 +406,57 @@ class RecordService:
         selectinload(Record.bank_account),
     ]
 
-    async def get_record(self, record_id: str, workspace_id: str) -> Record:
-        """Get a record by ID."""
-        result = await self.db.execute(
-            select(Record)
-            .options(*self._audit_options)
-            .where(
-                Record.id == record_id,
-                Record.workspace_id == workspace_id,
-            )
+    async def get_record(
+        self, record_id: str, workspace_id: str, with_audit: bool = True
+    ) -> Record:
+        """Get a record by ID.
+
+        ``with_audit=False`` skips the audit/bank relationship loads (one query
+        instead of five) for callers that never build a RecordResponse, such
+        as delete.
+        """
+        query = select(Record).where(
+            Record.id == record_id,
+            Record.workspace_id == workspace_id,
         )
+        if with_audit:
+            query = query.options(*self._audit_options)
+        result = await self.db.execute(query)
         record = result.scalar_one_or_none()
         if not record:
             raise NotFoundException(f"Record {record_id} not found")
         return record
 
-    async def list_records(
+    async def get_records_by_id(
+        self, record_ids: list[str], workspace_id: str
+    ) -> dict[str, Record]:
+        """Get several records in one query, keyed by ID (no audit loads, like
+        ``get_record(..., with_audit=False)``). Missing IDs are simply absent."""
+        if not record_ids:
+            return {}
+        result = await self.db.execute(
+            select(Record).where(
+                Record.id.in_(record_ids),
+                Record.workspace_id == workspace_id,
+            )
+        )
+        return {record.id: record for record in result.scalars()}
+
+    async def _build_list_query(
         self,
         workspace_id: str,
         filters: RecordFilter,
-        member: WorkspaceMember | None = None,
-        current_user_id: str | None = None,
-        limit: int | None = None,
-        offset: int = 0,
-    ) -> tuple[list[Record], int]:
-        """List records with filters and permission-based filtering."""
+        readable_areas: Collection[str] | None = None,
+    ):
+        """Build the filtered, ordered SELECT shared by list and stream paths."""
         query = select(Record).where(Record.workspace_id == workspace_id)
 
         if filters.area:
             query = query.where(Record.area == filters.area)
 
+        if readable_areas is not None:
+            query = query.where(Record.area.in_(readable_areas))
+
         if filters.stage:
             query = query.where(Record.stage == filters.stage)
 
@@ -451,37 +522,142 @@ class RecordService:
         if not filters.include_deleted:
             query = query.where(Record.deleted_at.is_(None))
 
-        query = query.order_by(Record.date_cashflow, Record.created_at)
+        # Record.id makes the ordering total, which keyset pagination relies on.
+        return query.order_by(Record.date_cashflow, Record.created_at, Record.id)
 
-        # COUNT total matching records (before pagination)
-        count_result = await self.db.execute(select(func.count()).select_from(query.subquery()))
-        total = count_result.scalar_one()
+    @staticmethod
+    def _filter_readable(
+        records: list[Record],
+        member: WorkspaceMember | None,
+        current_user_id: str | None,
+    ) -> list[Record]:
+        """Apply granular can_read_others filtering if member provided."""
+        if not (member and current_user_id):
+            return records
+
+        filtered_records = []
+        for record in records:
+            sign = get_sign_from_amount(record.amount)
+            # Check if user can read this record
+            can_read = check_granular_permission(
+                member, record.area, sign, "can_read_others",
+                record.created_by, current_user_id
+            )
+            # User can always see their own records
+            if can_read or record.created_by == current_user_id:
+                filtered_records.append(record)
+        return filtered_records
+
+    async def list_records(
+        self,
+        workspace_id: str,
+        filters: RecordFilter,
+        member: WorkspaceMember | None = None,
+        current_user_id: str | None = None,
+        limit: int | None = None,
+        offset: int = 0,
+        readable_areas: Collection[str] | None = None,
+    ) -> tuple[list[Record], int, str | None]:
+        """List records with filters and permission-based filtering.
+
+        When ``readable_areas`` is given, the area restriction is applied in SQL
+        so that ``total`` and pagination only count rows the member can read.
+        Returns the records, the total and the keyset cursor for the next page
+        (None when the page is the last one or the listing is unpaged).
+        """
+        base_query = await self._build_list_query(workspace_id, filters, readable_areas)
 
         # Apply pagination at SQL level
+        query = base_query
         if offset:
             query = query.offset(offset)
         if limit is not None:
             query = query.limit(limit)
 
         result = await self.db.execute(query.options(*self._audit_options))
-        records = list(result.scalars().all())
+        rows = list(result.scalars().all())
 
-        # Apply granular permission filtering if member provided
-        if member and current_user_id:
-            filtered_records = []
-            for record in records:
-                sign = get_sign_from_amount(record.amount)
-                # Check if user can read this record
-                can_read = check_granular_permission(
-                    member, record.area, sign, "can_read_others",
-                    record.created_by, current_user_id
-                )
-                # User can always see their own records
-                if can_read or record.created_by == current_user_id:
-                    filtered_records.append(record)
-            records = filtered_records
+        # A page that is not full ends the result set, so the total is known
+        # without a COUNT. That covers unpaged reads, the common case for the
+        # web client. Otherwise count matching records before pagination.
+        if (limit is None or len(rows) < limit) and (rows or not offset):
+            total = offset + len(rows)
+        else:
+            count_result = await self.db.execute(
+                select(func.count()).select_from(base_query.subquery())
+            )
+            total = count_result.scalar_one()
+
+        # As in list_records_after, the cursor comes from the last row read before
+        # granular filtering, so a page whose rows were all filtered out still advances.
+        next_cursor = (
+            encode_record_cursor(rows[-1])
+            if limit is not None and rows and offset + len(rows) < total
+            else None
+        )
+        records = self._filter_readable(rows, member, current_user_id)
+
+        return records, total, next_cursor
+
+    async def list_records_after(
+        self,
+        workspace_id: str,
+        filters: RecordFilter,
+        after: str,
+        limit: int,
+        member: WorkspaceMember | None = None,
+        current_user_id: str | None = None,
+        readable_areas: Collection[str] | None = None,
+    ) -> tuple[list[Record], str | None]:
+        """Keyset-paginated listing: the page of records following ``after``.
+
+        Seeks directly past the cursor position instead of scanning OFFSET rows
+        and skips the COUNT query. Returns the page and the cursor for the next
+        page (None when this is the last one).
+        """
+        query = await self._build_list_query(workspace_id, filters, readable_areas)
+        if after:
+            query = query.where(
+                tuple_(Record.date_cashflow, Record.created_at, Record.id)
+                > decode_record_cursor(after)
+            )
 
-        return records, total
+        # Fetch one extra row to know whether another page exists
+        result = await self.db.execute(query.limit(limit + 1).options(*self._audit_options))
+        rows = list(result.scalars().all())
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+
+        # The cursor comes from the last row read, before granular filtering,
+        # so a page whose rows were all filtered out still advances.
+        next_cursor = encode_record_cursor(rows[-1]) if has_more else None
+        return self._filter_readable(rows, member, current_user_id), next_cursor
+
+    STREAM_BATCH_SIZE = 500
+
+    async def stream_records(
+        self,
+        workspace_id: str,
+        filters: RecordFilter,
+        member: WorkspaceMember | None = None,
+        current_user_id: str | None = None,
+        readable_areas: Collection[str] | None = None,
+    ) -> AsyncIterator[list[Record]]:
+        """Yield matching records in batches of STREAM_BATCH_SIZE.
+
+        Rows are fetched with ``yield_per`` so memory stays bounded by one batch
+        regardless of how many records match.
+        """
+        query = await self._build_list_query(workspace_id, filters, readable_areas)
+        result = await self.db.stream_scalars(
+            query.options(*self._audit_options).execution_options(
+                yield_per=self.STREAM_BATCH_SIZE
+            )
+        )
+        async for batch in result.partitions():
+            records = self._filter_readable(list(batch), member, current_user_id)
+            if records:
+                yield records
 
     async def update_record(
         self,
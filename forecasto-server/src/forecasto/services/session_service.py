@@ -6,7 +6,7 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Any
 
-from sqlalchemy import and_, select
+from sqlalchemy import RowMapping, and_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -32,6 +32,29 @@ from forecasto.schemas.session import (
     UndoResponse,
 )
 
+# Columns exposed by OperationResponse, in response order.
+_OPERATION_HISTORY_COLUMNS = (
+    SessionOperation.id,
+    SessionOperation.sequence,
+    SessionOperation.operation_type,
+    SessionOperation.record_id,
+    SessionOperation.area,
+    SessionOperation.before_snapshot,
+    SessionOperation.after_snapshot,
+    SessionOperation.from_area,
+    SessionOperation.to_area,
+    SessionOperation.is_undone,
+    SessionOperation.created_at,
+)
+
+# changes_summary counter bumped by each operation type.
+_SUMMARY_KEYS = {
+    "create": "created",
+    "update": "updated",
+    "delete": "deleted",
+    "transfer": "transferred",
+}
+
 class SessionService:
     """Service for session management."""
 
@@ -136,6 +159,19 @@ class SessionService:
         )
         return list(result.scalars().all())
 
+    async def get_operation_rows(self, session_id: str) -> list[RowMapping]:
+        """Get a session's operation history as plain row mappings.
+
+        Read-only counterpart of get_operations for the history endpoint: selects
+        only the OperationResponse columns and skips ORM hydration.
+        """
+        result = await self.db.execute(
+            select(*_OPERATION_HISTORY_COLUMNS)
+            .where(SessionOperation.session_id == session_id)
+            .order_by(SessionOperation.sequence)
+        )
+        return list(result.mappings().all())
+
     async def add_operation(
         self,
         session: Session,
@@ -174,17 +210,11 @@ class SessionService:
         self.db.add(operation)
 
         # Update session summary
-        summary = session.changes_summary.copy()
-        if operation_type == "create":
-            summary["created"] = summary.get("created", 0) + 1
-        elif operation_type == "update":
-            summary["updated"] = summary.get("updated", 0) + 1
-        elif operation_type == "delete":
-            summary["deleted"] = summary.get("deleted", 0) + 1
-        elif operation_type == "transfer":
-            summary["transferred"] = summary.get("transferred", 0) + 1
-
-        session.changes_summary = summary
+        # Reassign a new dict: in-place JSON mutations are not tracked
+        key = _SUMMARY_KEYS.get(operation_type)
+        if key is not None:
+            summary = session.changes_summary
+            session.changes_summary = {**summary, key: summary.get(key, 0) + 1}
         session.changes_count = session.changes_count + 1
         session.last_activity = datetime.utcnow()
 
@@ -211,8 +241,7 @@ class SessionService:
             raise ValidationException("Nothing to undo")
 
         # Get the record
-        result = await self.db.execute(select(Record).where(Record.id == operation.record_id))
-        record = result.scalar_one_or_none()
+        record = await self.db.get(Record, operation.record_id)
 
         if operation.operation_type == "create":
             # Mark as deleted
@@ -236,9 +265,8 @@ class SessionService:
         message = await self.add_message(
             session, f"Undo: {operation.operation_type} operation reverted", "system"
         )
+        # All columns are populated client-side, so no refresh round-trip is needed.
         await self.db.flush()
-        await self.db.refresh(message)
-        await self.db.refresh(operation)
 
         session.last_activity = datetime.utcnow()
 
@@ -268,8 +296,7 @@ class SessionService:
             raise ValidationException("Nothing to redo")
 
         # Get the record
-        result = await self.db.execute(select(Record).where(Record.id == operation.record_id))
-        record = result.scalar_one_or_none()
+        record = await self.db.get(Record, operation.record_id)
 
         if operation.operation_type == "create":
             # Restore record
@@ -293,9 +320,8 @@ class SessionService:
         message = await self.add_message(
             session, f"Redo: {operation.operation_type} operation reapplied", "system"
         )
+        # All columns are populated client-side, so no refresh round-trip is needed.
         await self.db.flush()
-        await self.db.refresh(message)
-        await self.db.refresh(operation)
 
         session.last_activity = datetime.utcnow()
 
@@ -308,24 +334,21 @@ class SessionService:
         """Check for conflicts before commit."""
         conflicts = []
 
+        # Locked records and their last modifier are batch-loaded (one IN query
+        # each) instead of two SELECTs per lock.
         result = await self.db.execute(
             select(SessionRecordLock)
+            .options(selectinload(SessionRecordLock.record).selectinload(Record.updater))
             .where(SessionRecordLock.session_id == session.id)
         )
         locks = result.scalars().all()
 
         for lock in locks:
-            result = await self.db.execute(
-                select(Record).where(Record.id == lock.record_id)
-            )
-            record = result.scalar_one_or_none()
+            record = lock.record
 
             if record and record.version != lock.base_version:
                 # Get who modified
-                result = await self.db.execute(
-                    select(User).where(User.id == record.updated_by)
-                )
-                modifier = result.scalar_one_or_none()
+                modifier = record.updater
 
                 conflicts.append(
                     ConflictInfo(
@@ -363,10 +386,7 @@ class SessionService:
         locks = result.scalars().all()
 
         for lock in locks:
-            result = await self.db.execute(
-                select(Record).where(Record.id == lock.record_id)
-            )
-            record = result.scalar_one_or_none()
+            record = await self.db.get(Record, lock.record_id)
             if record:
                 self._apply_snapshot(record, lock.draft_snapshot)
                 record.version += 1
@@ -409,10 +429,7 @@ class SessionService:
             )
             lock = result.scalar_one_or_none()
 
-            result = await self.db.execute(
-                select(Record).where(Record.id == resolution.record_id)
-            )
-            record = result.scalar_one_or_none()
+            record = await self.db.get(Record, resolution.record_id)
 
             if not lock or not record:
                 continue
@@ -450,10 +467,7 @@ class SessionService:
         create_ops = result.scalars().all()
 
         for op in create_ops:
-            result = await self.db.execute(
-                select(Record).where(Record.id == op.record_id)
-            )
-            record = result.scalar_one_or_none()
+            record = await self.db.get(Record, op.record_id)
             if record:
                 await self.db.delete(record)
 
@@ -470,10 +484,7 @@ class SessionService:
 
         for op in modify_ops:
             if op.before_snapshot:
-                result = await self.db.execute(
-                    select(Record).where(Record.id == op.record_id)
-                )
-                record = result.scalar_one_or_none()
+                record = await self.db.get(Record, op.record_id)
                 if record:
                     self._apply_snapshot(record, op.before_snapshot)
                     if op.operation_type == "delete":
@@ -25,8 +25,11 @@ class TransferService:
         to_area: str,
         user: User,
         note: str | None = None,
-    ) -> Record:
-        """Transfer a record from one area to another."""
+    ) -> tuple[Record, str]:
+        """Transfer a record from one area to another.
+
+        Returns the record and the area it was transferred from.
+        """
         if to_area not in VALID_AREAS:
             raise InvalidTransferException(f"Invalid target area: {to_area}")
 
@@ -34,23 +37,23 @@ class TransferService:
             raise InvalidTransferException("Record is already in the target area")
 
         from_area = record.area
+        now = datetime.utcnow()
 
         # Update area
         record.area = to_area
         record.updated_by = user.id
-        record.updated_at = datetime.utcnow()
+        record.updated_at = now
         record.version += 1
 
         # Add to transfer history
         transfer_entry = {
             "from_area": from_area,
             "to_area": to_area,
-            "transferred_at": datetime.utcnow().isoformat(),
+            "transferred_at": now.isoformat(),
             "transferred_by": user.id,
             "note": note,
         }
-        history = list(record.transfer_history)
-        history.append(transfer_entry)
-        record.transfer_history = history
+        # Assign a new list so SQLAlchemy detects the JSON column change
+        record.transfer_history = [*record.transfer_history, transfer_entry]
 
-        return record
+        return record, from_area
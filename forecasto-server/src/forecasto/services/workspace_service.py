@@ -8,7 +8,7 @@ from datetime import datetime, timedelta
 
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload, selectinload
 
 from forecasto.exceptions import ForbiddenException, NotFoundException, ValidationException
 from forecasto.models.user import User
@@ -125,7 +125,7 @@ class WorkspaceService:
         """Get all members of a workspace with user relationship eagerly loaded."""
         result = await self.db.execute(
             select(WorkspaceMember)
-            .options(selectinload(WorkspaceMember.user))
+            .options(joinedload(WorkspaceMember.user))
             .where(WorkspaceMember.workspace_id == workspace_id)
             .order_by(WorkspaceMember.joined_at)
         )
@@ -143,8 +143,11 @@ class WorkspaceService:
         if requesting_member.role not in ("owner", "admin"):
             raise ForbiddenException("Only owners and admins can update members")
 
+        # The user is joined in so the caller can build a MemberResponse directly
         result = await self.db.execute(
-            select(WorkspaceMember).where(
+            select(WorkspaceMember)
+            .options(joinedload(WorkspaceMember.user))
+            .where(
                 WorkspaceMember.workspace_id == workspace_id,
                 WorkspaceMember.user_id == user_id,
             )
@@ -471,11 +474,9 @@ class WorkspaceService:
 
     async def get_pending_invitations_for_user(self, user: User) -> list[Invitation]:
         """Get all pending invitations for a user by their invite_code."""
-        from sqlalchemy.orm import selectinload
-
         result = await self.db.execute(
             select(Invitation)
-            .options(selectinload(Invitation.workspace))
+            .options(joinedload(Invitation.workspace))
             .where(
                 Invitation.invite_code == user.invite_code,
                 Invitation.accepted_at.is_(None),
@@ -647,6 +648,7 @@ class WorkspaceService:
         member = WorkspaceMember(
             workspace_id=invitation.workspace_id,
             user_id=user.id,
+            user=user,
             role=invitation.role,
             area_permissions=invitation.area_permissions or {
                 "actual": "write",
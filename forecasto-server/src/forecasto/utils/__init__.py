@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 
+from forecasto.utils.responses import ORJSONResponse
 from forecasto.utils.security import (
     create_access_token,
     create_refresh_token,
@@ -12,6 +13,7 @@ from forecasto.utils.security import (
 )
 
 __all__ = [
+    "ORJSONResponse",
     "hash_password",
     "verify_password",
     "create_access_token",
@@ -0,0 +1,58 @@
+"""Response classes shared by the API routers."""
+
+from __future__ import annotations
+
+from decimal import Decimal
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse, Response
+from pydantic import BaseModel
+
+
+def _orjson_default(value: Any) -> Any:
+    """Serialize the types orjson does not handle natively.
+
+    Decimals are emitted as strings, matching pydantic's JSON mode.
+    """
+    if isinstance(value, Decimal):
+        return str(value)
+    raise TypeError
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson.
+
+    Endpoints return an instance directly with a payload that is already made of
+    JSON-native types (e.g. from ``TypeAdapter.dump_python(..., mode="json")``),
+    which bypasses FastAPI's ``jsonable_encoder`` pass entirely. Raw row
+    mappings work too: dates and datetimes are formatted by orjson in C and
+    Decimals go through ``_orjson_default``.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=_orjson_default, option=orjson.OPT_NON_STR_KEYS)
+
+class PydanticResponse(Response):
+    """JSON response rendered from a pydantic model by pydantic-core.
+
+    Endpoints return an instance wrapping the response model itself; the
+    ``model_dump_json`` call serializes it in one pass without building an
+    intermediate dict.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: BaseModel) -> bytes:
+        return content.model_dump_json().encode()
+
+def list_envelope(key: str, items_json: bytes) -> Response:
+    """Wrap an already-serialized JSON array in the ``{"success": true, ...}`` envelope.
+
+    ``items_json`` is typically ``TypeAdapter.dump_json(...)`` output, so the
+    list goes from pydantic-core straight to the wire without an intermediate
+    Python dict per item.
+    """
+    return Response(
+        b'{"success":true,"' + key.encode() + b'":' + items_json + b"}",
+        media_type="application/json",
+    )
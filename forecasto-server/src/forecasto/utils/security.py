@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 
+import secrets
 from datetime import datetime, timedelta
 from typing import Any
 
@@ -15,6 +16,12 @@ pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 ALGORITHM = "HS256"
 
+# Settings are frozen, so these are fixed for the process lifetime
+_SECRET_KEY = settings.secret_key
+_DECODE_ALGORITHMS = [ALGORITHM]
+_ACCESS_TOKEN_EXPIRE = timedelta(minutes=settings.access_token_expire_minutes)
+_REFRESH_TOKEN_EXPIRE = timedelta(days=settings.refresh_token_expire_days)
+
 def hash_password(password: str) -> str:
     """Hash a password using bcrypt."""
 
@@ -30,21 +37,36 @@ def create_access_token(data: dict[str, Any], expires_delta: timedelta | None =
     if expires_delta:
         expire = datetime.utcnow() + expires_delta
     else:
-        expire = datetime.utcnow() + timedelta(minutes=settings.access_token_expire_minutes)
+        expire = datetime.utcnow() + _ACCESS_TOKEN_EXPIRE
     to_encode.update({"exp": expire, "type": "access"})
-    return jwt.encode(to_encode, settings.secret_key, algorithm=ALGORITHM)
+    return jwt.encode(to_encode, _SECRET_KEY, algorithm=ALGORITHM)
 
 def create_refresh_token(data: dict[str, Any]) -> str:
     """Create a JWT refresh token."""
     to_encode = data.copy()
-    expire = datetime.utcnow() + timedelta(days=settings.refresh_token_expire_days)
+    expire = datetime.utcnow() + _REFRESH_TOKEN_EXPIRE
     to_encode.update({"exp": expire, "type": "refresh"})
-    return jwt.encode(to_encode, settings.secret_key, algorithm=ALGORITHM)
+    return jwt.encode(to_encode, _SECRET_KEY, algorithm=ALGORITHM)
 
 def decode_token(token: str) -> dict[str, Any]:
     """Decode and validate a JWT token."""
     try:
-        payload = jwt.decode(token, settings.secret_key, algorithms=[ALGORITHM])
+        payload = jwt.decode(token, _SECRET_KEY, algorithms=_DECODE_ALGORITHMS)
         return payload
     except JWTError as e:
         raise ValueError(f"Invalid token: {e}") from e
+
+# Invite/registration code alphabet, without ambiguous characters:
+# A-Z excluding O, I, L and 2-9 excluding 0, 1.
+# Random byte -> alphabet character as b % 31. Bytes >= 248 (8 * 31) are
+# dropped so every character stays equally likely.
+CODE_ALPHABET = b"ABCDEFGHJKMNPQRSTUVWXYZ23456789"
+_CODE_BYTE_MAP = bytes(CODE_ALPHABET[b % len(CODE_ALPHABET)] for b in range(256))
+_CODE_BYTE_REJECT = bytes(range(248, 256))
+
+def generate_code(length: int) -> str:
+    """Generate ``length`` random characters from CODE_ALPHABET."""
+    code = b""
+    while len(code) < length:
+        code += secrets.token_bytes(length + 4).translate(_CODE_BYTE_MAP, _CODE_BYTE_REJECT)
+    return code[:length].decode()
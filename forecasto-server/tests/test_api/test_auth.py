@@ -5,6 +5,10 @@ from __future__ import annotations
 
 import pytest
 from httpx import AsyncClient
+from jose import jwt
+
+from forecasto.dependencies import _decode_token_cached, _token_cache
+from forecasto.utils.security import ALGORITHM, create_access_token
 
 @pytest.mark.asyncio
 async def test_login_success(client: AsyncClient, test_user):
@@ -79,3 +83,40 @@ async def test_logout(client: AsyncClient, test_user):
     )
     assert response.status_code == 200
     assert response.json()["success"] is True
+
+def test_decode_token_cached_reuses_payload():
+    """Test repeat verifications of the same token hit the cache."""
+    token = create_access_token({"sub": "cached-user"})
+
+    first = _decode_token_cached(token)
+    assert _decode_token_cached(token) is first
+    assert first["sub"] == "cached-user"
+
+def test_decode_token_cached_skips_invalid_tokens():
+    """Test failed verifications are not cached."""
+    token = jwt.encode({"sub": "cached-user", "type": "access"}, "wrong-key", algorithm=ALGORITHM)
+
+    with pytest.raises(ValueError):
+        _decode_token_cached(token)
+    assert token not in _token_cache
+
+@pytest.mark.asyncio
+async def test_blocked_user_rejected_on_next_request(
+    authenticated_client: AsyncClient, db_session, test_user
+):
+    """Test blocking a user takes effect on the very next request."""
+    response = await authenticated_client.get("/api/v1/users/me")
+    assert response.status_code == 200
+
+    test_user.is_blocked = True
+    await db_session.commit()
+
+    response = await authenticated_client.get("/api/v1/users/me")
+    assert response.status_code == 401
+
+@pytest.mark.asyncio
+async def test_non_bearer_authorization_rejected(client: AsyncClient, auth_headers: dict):
+    """Test a token without the Bearer scheme is rejected."""
+    token = auth_headers["Authorization"].removeprefix("Bearer ")
+    response = await client.get("/api/v1/users/me", headers={"Authorization": f"Token {token}"})
+    assert response.status_code == 401
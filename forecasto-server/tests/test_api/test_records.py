@@ -3,12 +3,48 @@
 from __future__ import annotations
 
 
+import json
 from datetime import date
 from decimal import Decimal
 
 import pytest
 from httpx import AsyncClient
 
+from forecasto.models.user import User
+from forecasto.models.workspace import WorkspaceMember
+from forecasto.utils.security import create_access_token, hash_password
+
+def _bulk_payload(n: int, prefix: str, **overrides) -> list[dict]:
+    """Build n bulk-import record dicts with accounts "<prefix> 0".."<prefix> n-1".
+
+    Callable overrides are called with the record index; total follows amount.
+    """
+    payload = []
+    for i in range(n):
+        record = {
+            "area": "budget",
+            "type": "0",
+            "account": f"{prefix} {i}",
+            "reference": "REF",
+            "date_cashflow": "2026-02-01",
+            "date_offer": "2026-01-25",
+            "amount": "10.00",
+            "stage": "0",
+        }
+        record.update(
+            {key: value(i) if callable(value) else value for key, value in overrides.items()}
+        )
+        record.setdefault("total", record["amount"])
+        payload.append(record)
+    return payload
+
+async def _bulk_import(client: AsyncClient, workspace_id: str, n: int, prefix: str, **overrides):
+    """Bulk-import n records built by _bulk_payload and return the response."""
+    return await client.post(
+        f"/api/v1/workspaces/{workspace_id}/records/bulk-import",
+        json=_bulk_payload(n, prefix, **overrides),
+    )
+
 @pytest.mark.asyncio
 async def test_create_record_with_session(authenticated_client: AsyncClient, test_workspace):
     """Test creating a record with active session."""
@@ -239,3 +275,208 @@ async def test_delete_record_soft_delete(authenticated_client: AsyncClient, test
     )
     assert response.status_code == 200
     assert response.json()["success"] is True
+
+@pytest.mark.asyncio
+async def test_bulk_import_assigns_sequential_numbers(
+    authenticated_client: AsyncClient, test_workspace
+):
+    """Test bulk import creates all records in one call with consecutive seq_num."""
+    response = await _bulk_import(
+        authenticated_client,
+        test_workspace.id,
+        3,
+        "BULK",
+        amount="100.00",
+    )
+    assert response.status_code == 201
+    data = response.json()
+    assert data["total"] == 3
+    seq_nums = sorted(r["seq_num"] for r in data["records"])
+    assert seq_nums == list(range(seq_nums[0], seq_nums[0] + 3))
+
+@pytest.mark.asyncio
+async def test_bulk_delete_records_reports_missing_ids(
+    authenticated_client: AsyncClient, test_workspace
+):
+    """Test bulk delete removes the found records and reports unknown IDs."""
+    response = await _bulk_import(authenticated_client, test_workspace.id, 2, "DELETE")
+    ids = [r["id"] for r in response.json()["records"]]
+
+    response = await authenticated_client.request(
+        "DELETE",
+        f"/api/v1/workspaces/{test_workspace.id}/records/bulk",
+        json={"ids": [*ids, "missing-id"]},
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["deleted_count"] == 2
+    assert data["errors"] == [{"id": "missing-id", "error": "Record missing-id not found"}]
+
+@pytest.mark.asyncio
+async def test_export_records_json_and_ndjson(
+    authenticated_client: AsyncClient, test_workspace
+):
+    """Test export returns the same records as JSON and as streamed NDJSON."""
+    await _bulk_import(
+        authenticated_client,
+        test_workspace.id,
+        2,
+        "EXPORT",
+        area="actual",
+        date_cashflow=lambda i: f"2026-03-0{i + 1}",
+        date_offer="2026-02-20",
+        amount="50.00",
+    )
+
+    response = await authenticated_client.get(
+        f"/api/v1/workspaces/{test_workspace.id}/records/export"
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total"] == 2
+    assert [r["account"] for r in data["records"]] == ["EXPORT 0", "EXPORT 1"]
+
+    response = await authenticated_client.get(
+        f"/api/v1/workspaces/{test_workspace.id}/records/export",
+        params={"format": "ndjson"},
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [r["account"] for r in lines] == ["EXPORT 0", "EXPORT 1"]
+
+@pytest.mark.asyncio
+async def test_list_records_keyset_pagination(
+    authenticated_client: AsyncClient, test_workspace
+):
+    """Test walking pages with next_cursor returns every record exactly once."""
+    await _bulk_import(
+        authenticated_client,
+        test_workspace.id,
+        5,
+        "PAGE",
+        area="prospect",
+        date_cashflow=lambda i: f"2026-04-0{i + 1}",
+        date_offer="2026-03-20",
+    )
+
+    url = f"/api/v1/workspaces/{test_workspace.id}/records"
+    response = await authenticated_client.get(url, params={"area": "prospect", "limit": 2})
+    data = response.json()
+    accounts = [r["account"] for r in data["records"]]
+    assert data["total_records"] == 5
+
+    while data["has_more"]:
+        response = await authenticated_client.get(
+            url, params={"area": "prospect", "limit": 2, "after": data["next_cursor"]}
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total_records"] is None
+        accounts.extend(r["account"] for r in data["records"])
+
+    assert accounts == [f"PAGE {i}" for i in range(5)]
+
+    response = await authenticated_client.get(url, params={"after": "not-a-cursor"})
+    assert response.status_code == 400
+
+@pytest.mark.asyncio
+async def test_list_records_pages_past_filtered_page(
+    authenticated_client: AsyncClient, db_session, test_workspace
+):
+    """Test a member pages past a page whose rows are all hidden by granular permissions."""
+    await _bulk_import(authenticated_client, test_workspace.id, 2, "OTHER")
+
+    member = User(
+        email="reader@example.com",
+        password_hash=hash_password("x"),
+        name="Reader",
+        email_verified=True,
+    )
+    db_session.add(member)
+    await db_session.commit()
+    await db_session.refresh(member)
+    hidden = {"can_read_others": False, "can_create": True, "can_edit_others": False}
+    db_session.add(
+        WorkspaceMember(
+            workspace_id=test_workspace.id,
+            user_id=member.id,
+            role="member",
+            granular_permissions={"budget": {"in": hidden, "out": hidden}},
+        )
+    )
+    await db_session.commit()
+    token = create_access_token({"sub": member.id, "email": member.email})
+    headers = {"Authorization": f"Bearer {token}"}
+
+    response = await authenticated_client.post(
+        f"/api/v1/workspaces/{test_workspace.id}/records/bulk-import",
+        headers=headers,
+        json=_bulk_payload(1, "OWN", date_cashflow="2026-03-01"),
+    )
+    assert response.status_code == 201
+
+    url = f"/api/v1/workspaces/{test_workspace.id}/records"
+    response = await authenticated_client.get(
+        url, headers=headers, params={"limit": 2, "offset": 0}
+    )
+    data = response.json()
+    assert data["records"] == []
+    assert data["has_more"] is True
+    assert data["next_cursor"] is not None
+
+    response = await authenticated_client.get(
+        url, headers=headers, params={"limit": 2, "after": data["next_cursor"]}
+    )
+    data = response.json()
+    assert [r["account"] for r in data["records"]] == ["OWN 0"]
+    assert data["has_more"] is False
+
+@pytest.mark.asyncio
+async def test_list_records_is_gzip_compressed(
+    authenticated_client: AsyncClient, test_workspace
+):
+    """Test large list responses are gzip-encoded when the client accepts it."""
+    await _bulk_import(
+        authenticated_client,
+        test_workspace.id,
+        5,
+        "GZIP",
+        date_cashflow="2026-05-01",
+        date_offer="2026-04-20",
+    )
+
+    response = await authenticated_client.get(
+        f"/api/v1/workspaces/{test_workspace.id}/records",
+        params={"area": "budget"},
+        headers={"Accept-Encoding": "gzip"},
+    )
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert len(response.json()["records"]) >= 5
+
+@pytest.mark.asyncio
+async def test_list_records_total_with_short_and_full_pages(
+    authenticated_client: AsyncClient, test_workspace
+):
+    """Test total_records is exact whether or not the page is full."""
+    await _bulk_import(
+        authenticated_client,
+        test_workspace.id,
+        3,
+        "TOTAL",
+        area="orders",
+        date_cashflow="2026-06-01",
+        date_offer="2026-05-20",
+    )
+
+    url = f"/api/v1/workspaces/{test_workspace.id}/records"
+    for params in (
+        {"area": "orders"},
+        {"area": "orders", "limit": 2},
+        {"area": "orders", "limit": 2, "offset": 2},
+        {"area": "orders", "limit": 10},
+        {"area": "orders", "limit": 2, "offset": 5},
+    ):
+        response = await authenticated_client.get(url, params=params)
+        assert response.json()["total_records"] == 3, params
@@ -97,3 +97,4 @@ async def test_transfer_history_updated(authenticated_client: AsyncClient, test_
     history = transfer_response.json()["record"]["transfer_history"]
     assert len(history) >= 2
     assert history[-1]["to_area"] == "orders"
+    assert transfer_response.json()["operation"]["from_area"] == "prospect"
@@ -62,3 +62,17 @@ async def test_update_profile(authenticated_client: AsyncClient, test_user):
     assert response.status_code == 200
     data = response.json()
     assert data["name"] == "Updated Name"
+
+@pytest.mark.asyncio
+async def test_lookup_user_by_code(authenticated_client: AsyncClient, test_user):
+    """Test invite-code lookup ignores case, dashes and spaces."""
+    sloppy = test_user.invite_code.lower().replace("-", " ")
+    response = await authenticated_client.get(f"/api/v1/users/lookup/{sloppy}")
+    assert response.status_code == 200
+    assert response.json()["user"] == {
+        "name": test_user.name,
+        "invite_code": test_user.invite_code,
+    }
+
+    response = await authenticated_client.get("/api/v1/users/lookup/ZZZ-ZZZ-ZZZ")
+    assert response.status_code == 404
@@ -3,9 +3,13 @@
 from __future__ import annotations
 
 
+from datetime import datetime, timedelta
+
 import pytest
 from httpx import AsyncClient
 
+from forecasto.models.workspace import Invitation, Workspace
+
 @pytest.mark.asyncio
 async def test_create_workspace(authenticated_client: AsyncClient):
     """Test workspace creation."""
@@ -45,6 +49,18 @@ async def test_get_workspace_not_found(authenticated_client: AsyncClient):
     response = await authenticated_client.get("/api/v1/workspaces/nonexistent-id")
     assert response.status_code == 404
 
+@pytest.mark.asyncio
+async def test_get_workspace_not_member(
+    authenticated_client: AsyncClient, db_session, test_user
+):
+    """Test an existing workspace without membership is forbidden, not missing."""
+    workspace = Workspace(name="Not Mine", owner_id=test_user.id)
+    db_session.add(workspace)
+    await db_session.commit()
+
+    response = await authenticated_client.get(f"/api/v1/workspaces/{workspace.id}")
+    assert response.status_code == 403
+
 @pytest.mark.asyncio
 async def test_list_members(authenticated_client: AsyncClient, test_workspace, test_user):
     """Test listing workspace members."""
@@ -92,3 +108,26 @@ async def test_update_member_permissions(
     data = response.json()
     assert data["success"] is True
     assert data["member"]["area_permissions"]["actual"] == "read"
+
+@pytest.mark.asyncio
+async def test_list_pending_invitations(
+    authenticated_client: AsyncClient, db_session, test_workspace, test_user
+):
+    """Test listing pending invitations includes the workspace name."""
+    db_session.add(
+        Invitation(
+            workspace_id=test_workspace.id,
+            invited_by=test_user.id,
+            invite_code=test_user.invite_code,
+            token_hash="pending-invitation-token",
+            expires_at=datetime.utcnow() + timedelta(days=7),
+        )
+    )
+    await db_session.commit()
+
+    response = await authenticated_client.get("/api/v1/workspaces/invitations/pending")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["success"] is True
+    assert len(data["invitations"]) == 1
+    assert data["invitations"][0]["workspace_name"] == "Test Workspace"
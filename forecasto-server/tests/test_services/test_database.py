@@ -0,0 +1,31 @@
+"""Tests for database session helpers."""
+
+from __future__ import annotations
+
+import pytest
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from forecasto.database import session_has_writes
+from forecasto.models.user import User
+
+
+@pytest.mark.asyncio
+async def test_read_only_transaction_has_no_writes(db_session: AsyncSession, test_user: User):
+    """Test plain SELECTs do not mark the session as written."""
+
+    await db_session.execute(select(User).where(User.id == test_user.id))
+    assert not session_has_writes(db_session)
+
+@pytest.mark.asyncio
+async def test_flushed_and_core_writes_are_tracked(db_session: AsyncSession, test_user: User):
+    """Test flushed changes and Core DML both require a commit."""
+    test_user.name = "Renamed"
+    assert session_has_writes(db_session)
+    await db_session.flush()
+    assert session_has_writes(db_session)
+    await db_session.commit()
+    assert not session_has_writes(db_session)
+
+    await db_session.execute(update(User).where(User.id == test_user.id).values(name="Core"))
+    assert session_has_writes(db_session)
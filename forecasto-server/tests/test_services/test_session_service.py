@@ -13,6 +13,7 @@ from forecasto.models.record import Record
 from forecasto.models.session import Session, SessionRecordLock
 from forecasto.models.user import User
 from forecasto.models.workspace import Workspace
+from forecasto.schemas.session import OperationResponse
 from forecasto.services.session_service import SessionService
 
 @pytest.mark.asyncio
@@ -205,3 +206,40 @@ async def test_discard_restores_original(
 
     assert result.success is True
     assert result.session.status == "discarded"
+
+@pytest.mark.asyncio
+async def test_get_operation_rows_matches_response_schema(
+    db_session: AsyncSession, test_user: User, test_workspace: Workspace
+):
+    """Test operation history rows carry exactly the OperationResponse fields."""
+    service = SessionService(db_session)
+    session = await service.create_session(test_workspace.id, test_user, "History Test")
+
+    record = Record(
+        workspace_id=test_workspace.id,
+        area="orders",
+        type="0",
+        account="ORIGINAL",
+        reference="REF",
+        date_cashflow=date(2026, 1, 15),
+        date_offer=date(2026, 1, 10),
+        amount=Decimal("1000.00"),
+        vat=Decimal("220.00"),
+        total=Decimal("1220.00"),
+        stage="1",
+        created_by=test_user.id,
+    )
+    db_session.add(record)
+    await db_session.commit()
+
+    await service.add_operation(
+        session, "update", record, {"account": "ORIGINAL"}, {"account": "UPDATED"}
+    )
+    await db_session.commit()
+
+    rows = await service.get_operation_rows(session.id)
+
+    assert len(rows) == 1
+    assert set(rows[0].keys()) == set(OperationResponse.model_fields)
+    assert rows[0]["after_snapshot"] == {"account": "UPDATED"}
+    assert rows[0]["is_undone"] is False